@@ -0,0 +1,31 @@
+import argparse
+from core.bulk_sentiment import CHUNK_SIZE, bulk_score, csv_chunks, news_snapshot_chunks
+
+# Scores a large batch of headlines across a process pool and writes them to a Parquet file.
+# Usage: python backfill.py OUTPUT.parquet [--csv FILE [--column headline] [--keep COL ...]] [--start YYYY-MM-DD]
+#                           [--end YYYY-MM-DD] [--backend forest|hashed] [--workers N] [--chunk-size N]
+# Without --csv the recorded news snapshots (data/snapshots/news) are re-scored.
+def main():
+    parser = argparse.ArgumentParser(description="Bulk sentiment scoring")
+    parser.add_argument("output", help="Parquet file to write")
+    parser.add_argument("--csv", help="CSV file of headlines to score instead of the recorded news")
+    parser.add_argument("--column", default="headline", help="CSV column holding the headline")
+    parser.add_argument("--keep", nargs="*", default=[], help="other CSV columns to copy into the output")
+    parser.add_argument("--start", help="first recorded news date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="last recorded news date (YYYY-MM-DD)")
+    parser.add_argument("--backend", choices=["forest", "hashed"])
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if args.csv:
+        chunks = csv_chunks(args.csv, args.column, args.keep, args.chunk_size)
+    else:
+        chunks = news_snapshot_chunks(start=args.start, end=args.end, chunk_size=args.chunk_size)
+    column = args.column if args.csv else "headline"
+
+    stats = bulk_score(chunks, args.output, column=column, backend=args.backend, workers=args.workers)
+    print(f"✅ Scored {stats['rows']} headlines in {stats['chunks']} chunks in {stats['seconds']:.2f}s → {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import sys
+import time
+import pandas as pd
+from core.backtest import backtest, bars_from_snapshots, summarize
+from core.signal_log import open_prime_log
+
+# Backtests the logged Prime signals' Target/StopLoss levels against recorded prices.
+# Usage: python backtest.py [since YYYY-MM-DD] [bars.csv]
+# bars.csv needs ticker, timestamp, high, low, close columns; without it the recorded screener snapshots are used.
+def main():
+    since = sys.argv[1] if len(sys.argv) > 1 else None
+    bars_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    prime_log = open_prime_log()
+    signals = prime_log.history(since=since)
+    prime_log.close()
+    if not signals:
+        print("⚠️ No Prime signals logged yet.")
+        return
+
+    bars = pd.read_csv(bars_path) if bars_path else bars_from_snapshots(start=since)
+
+    began = time.perf_counter()
+    summary = summarize(backtest(signals, bars))
+    elapsed = time.perf_counter() - began
+
+    for key, value in summary.items():
+        print(f"{key:>18}: {value:.3f}" if isinstance(value, float) else f"{key:>18}: {value}")
+    print(f"✅ Backtested {len(signals)} signals against {len(bars)} bars in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -1,116 +1,179 @@
-import csv
 import sys
 import os
+import threading
+from datetime import datetime
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from datetime import datetime
-from core.sentiment import train_or_load_model, classify_headlines
-from core.finviz_api import fetch_all_finviz_api_news
+from core.sentiment import ModelLoader, classify_headlines, classify_tickers, prediction_cache_stats
+from core.finviz_api import cache_stats, client_stats
+from core.metrics import METRICS_PATH, metrics, dump_metrics
 import webbrowser
-from core.filters import rank_and_group_stocks
+from core.news import NewsIngester, news_key
+from core.signal_log import open_prime_log
+from core.recorder import SnapshotRecorder, RECORD_SNAPSHOTS
+from core.prices import PriceCache
+
+
+# Shows a missing value (e.g. a momentum rate before a ticker has history) as a blank cell
+def _cell(value):
+    return "" if value is None or value != value else value
 
+# Fetches and normalizes the live Finviz screener export
+def load_finviz_snapshot():
+    from core.finviz_api import fetch_finviz_data
+    from core.filters import normalize_snapshot
+    return normalize_snapshot(fetch_finviz_data())
 
 class Controller:
 
-    # Logs a prime ticker to the prime_log.csv file if not already logged today
-    def log_prime_ticker(ticker_data):
-        os.makedirs("logs", exist_ok=True)
-        log_path = "ScreenerProject/data/prime_log.csv"
-        fields = ["timestamp", "ticker", "price", "target", "stop_loss", "sentiment"]
-        new_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "ticker": ticker_data.get("Ticker"),
-            "price": ticker_data.get("Price"),
-            "target": ticker_data.get("Target"),
-            "stop_loss": ticker_data.get("StopLoss"),
-            "sentiment": ticker_data.get("Sentiment", "")
-        }
+    # Logs a prime ticker to the prime log if not already logged today
+    def log_prime_ticker(self, ticker_data, now=None):
+        return self.prime_log.record(ticker_data, now)
+
+    # Starts loading the sentiment model in the background; nothing is fetched until the first refresh, so the
+    # window can appear right away. pandas and the filters are imported on first use for the same reason.
+    # load_snapshot / fetch_news replace the live Finviz calls (e.g. with a ReplayFeed), prime_log replaces the
+    # on-disk log, recorder stores what each refresh saw and prices replaces the chart price cache.
+    # strategy names the strategies.json screen whose results are shown and logged. momentum replaces the per-ticker
+    # history the Delta/Rate columns come from (e.g. one on a replay clock); it is created on the first refresh.
+    def __init__(self, load_snapshot=None, fetch_news=None, prime_log=None, recorder=None, prices=None,
+                 strategy="default", momentum=None):
+        self.strategy = strategy
+        self.momentum = momentum
+        self.load_snapshot = load_snapshot or load_finviz_snapshot
+        self.model_loader = ModelLoader().start()
+        self.prime_log = prime_log or open_prime_log()
+        self.recorder = recorder or (SnapshotRecorder() if RECORD_SNAPSHOTS else None)
+        self.news = NewsIngester(fetch_news) if fetch_news else NewsIngester()
+        self.prices = prices or PriceCache()
+        self.positive_news = []
+        self.pending_news = []
+        self.held_primes = {}
+        self.news_lock = threading.Lock()
 
-        # Avoid duplicates
-        if os.path.exists(log_path):
-            with open(log_path, "r", newline="", encoding="utf-8") as f:
-                today = datetime.now().date()
+    # The sentiment model, or None until the background load finishes
+    @property
+    def model(self):
+        return self.model_loader.model
 
-                for row in csv.DictReader(f):
-                    row_date = datetime.fromisoformat(row["timestamp"]).date()
+    @property
+    def vectorizer(self):
+        return self.model_loader.vectorizer
 
-                    if row["ticker"] == new_entry["ticker"] and row_date == today:
-                        return  # Already logged today
-                    
-        with open(log_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
+    # All buffered news items, newest first
+    @property
+    def news_cache(self):
+        return self.news.newest()
 
-            if f.tell() == 0:
-                writer.writeheader()
-            writer.writerow(new_entry)
+    # Merges the latest news into the buffer and returns only the new items, recording them if enabled
+    def poll_news(self):
+        with metrics.time("news_poll"):
+            fresh = self.news.poll()
+        metrics.count("news_new", len(fresh))
+        if self.recorder:
+            self.recorder.record_news(fresh)
+        return fresh
 
-    # Loads the sentiment model and cached news headlines from Finviz
-    def __init__(self):
-        self.model, self.vectorizer = train_or_load_model()
-        self.news_cache = fetch_all_finviz_api_news()
+    # Polls the news feed and queues the new items for the next get_positive_news, dropping queued items that have
+    # aged out of the buffer (e.g. when nothing classifies them, as in headless --no-news)
+    def queue_news(self):
+        with self.news_lock:
+            pending = self.poll_news() + self.pending_news
+            self.pending_news = [item for item in pending if self.news.contains(news_key(item))]
 
-    # Generates formatted screener results for Prime and Subprime setups with sentiment
+    # Returns the newest cached news headline that mentions the ticker, or ""
+    def match_headline(self, ticker):
+        return self.news.headline(ticker)
+
+    # Generates formatted screener results for Prime and Subprime setups with sentiment.
+    # Fetch errors propagate so the refresh scheduler can back off and keep the last results on screen.
     def get_screener_results(self):
-        prime, subprime = rank_and_group_stocks()
-        results = []
+        return self.get_strategy_results([self.strategy])[self.strategy]
 
-        def classify_batch(batch):
-            formatted = []
-            for stock in batch:
-                ticker = stock.get('Ticker', '')
-                headline = ""
+    # Generates formatted Prime/Subprime results for several strategies (all configured ones by default) from a
+    # single snapshot: one fetch, one scoring pass and one sentiment batch. Returns {name: (prime, subprime)}.
+    def get_strategy_results(self, names=None):
+        from core.filters import rank_strategies
+        from core.momentum import MomentumTracker
 
-                # ✅ Match to a news headline
-                for news in self.news_cache:
+        # Every refresh pulls the news the headlines are matched against; new items wait for get_positive_news.
+        # A news outage only leaves the headlines stale here: the news refresh reports it and backs off.
+        try:
+            self.queue_news()
+        except Exception as e:
+            print(f"⚠️ News fetch failed, matching headlines against buffered news: {e}")
 
-                    if ticker in news.get("tickers", []):
-                        headline = news.get("headline", "")
-                        break
+        with metrics.time("fetch"):
+            snapshot = self.load_snapshot()
+        metrics.count("snapshot_rows", len(snapshot))
+        if self.recorder:
+            with metrics.time("record"):
+                self.recorder.record_screener(snapshot)
+        # Deltas against earlier refreshes become columns the strategies can rank on
+        if self.momentum is None:
+            self.momentum = MomentumTracker()
+        with metrics.time("momentum"):
+            snapshot = self.momentum.update(snapshot)
+        metrics.count("momentum_tickers", len(self.momentum.slots))
+        with metrics.time("rank"):
+            ranked = rank_strategies(snapshot, names)
+        if self.strategy in ranked:
+            metrics.count("prime_rows", len(ranked[self.strategy][0]))
+            metrics.count("subprime_rows", len(ranked[self.strategy][1]))
 
-                sentiment = ""
+        # Prime setups seen while the model loads are held back, so each is logged once with its sentiment
+        ready = self.model_loader.loaded.is_set()
+        primes = [(stock, datetime.now()) for stock in ranked.get(self.strategy, ([], []))[0]]
+        if not ready:
+            for stock, seen in primes:
+                self.held_primes.setdefault(stock.get('Ticker', ''), (stock, seen))
+            primes = []
+        elif self.held_primes:
+            primes = list(self.held_primes.values()) + primes
+            self.held_primes = {}
+
+        # ✅ Match every stock to a news headline, then classify them all in one model call
+        headlines = {}
+        stocks = [stock for prime, subprime in ranked.values() for stock in prime + subprime]
+        for stock in stocks + [stock for stock, _ in primes]:
+            ticker = stock.get('Ticker', '')
+            headline = self.match_headline(ticker)
+            if headline:
+                headlines[ticker] = headline
 
-                if self.model and headline:
-                    df = classify_headlines([headline], self.model, self.vectorizer)
+        model, vectorizer = self.model_loader.current()
+        with metrics.time("classify_tickers"):
+            sentiments = classify_tickers(headlines, model, vectorizer) if model else {}
+        metrics.count("headlines_matched", len(headlines))
 
-                    if not df.empty:
-                        sentiment = f"{df.iloc[0]['prediction']} ({int(df.iloc[0]['confidence_score']*100)}%)"
-                
+        def format_batch(batch):
+            formatted = []
+            for stock in batch:
+                ticker = stock.get('Ticker', '')
                 formatted.append([
                     ticker,
                     stock.get("Price", "?"),
                     stock.get("Float", "?"),
                     stock.get("RelVolume", "?"),
                     stock.get("ChangePercent", "?"),
+                    _cell(stock.get("RelVolumeRate")),
+                    _cell(stock.get("ChangeRate")),
                     stock.get("Target", "?"),
                     stock.get("StopLoss", "?"),
-                    sentiment
+                    sentiments.get(ticker, "")
                 ])
 
             return formatted
 
-        for stock in prime:
-            ticker = stock.get('Ticker', '')
-            headline = ""
-
-            for news in self.news_cache:
-                if ticker in news.get("tickers", []):
-                    headline = news.get("headline", "")
-                    break
-
-            sentiment = ""
-            if self.model and headline:
-                df = classify_headlines([headline], self.model, self.vectorizer)
-
-                if not df.empty:
-                    sentiment = f"{df.iloc[0]['prediction']} ({int(df.iloc[0]['confidence_score']*100)}%)"
-
-            stock["Sentiment"] = sentiment
-            Controller.log_prime_ticker(stock)
+        # Only the controller's own strategy feeds the prime log, stamped with when each setup was first seen
+        for stock, seen in primes:
+            stock["Sentiment"] = sentiments.get(stock.get('Ticker', ''), "")
+            self.log_prime_ticker(stock, seen)
+        # Writes out setups buffered by earlier refreshes once they have waited long enough
+        self.prime_log.flush_if_due()
 
-        prime_results = classify_batch(prime)
-        subprime_results = classify_batch(subprime)
-        return prime_results, subprime_results
+        return {name: (format_batch(prime), format_batch(subprime)) for name, (prime, subprime) in ranked.items()}
 
     """# Classifies a single custom headline
     def classify_single_headline(self, headline):
@@ -120,14 +183,22 @@ class Controller:
         df = classify_headlines([headline], self.model, self.vectorizer)
         return df.iloc[0] if not df.empty else None"""
 
-    # Returns a list of high-confidence positive headlines from the cached news
+    # Polls the news feed and returns the high-confidence positive headlines among the buffered news.
+    # Only items that arrived since the last call are classified. Fetch errors propagate so the news refresh backs off.
     def get_positive_news(self):
-        if not self.model:
+        # News keeps flowing into the buffer (and the queue) while the model loads
+        self.queue_news()
+        model, vectorizer = self.model_loader.current()
+        if not model:
             return []
-        
-        news = self.news_cache
+
+        with self.news_lock:
+            news, self.pending_news = self.pending_news, []
+
         headlines = [item['headline'] for item in news]
-        df = classify_headlines(headlines, self.model, self.vectorizer)
+        with metrics.time("classify_news"):
+            df = classify_headlines(headlines, model, vectorizer)
+        metrics.count("news_classified", len(headlines))
         positive = []
         for i, row in df.iterrows():
             if "Positive" in row['prediction'] and row['confidence_score'] >= 0.6:
@@ -135,10 +206,58 @@ class Controller:
                     "headline": row['headline'],
                     "confidence_score": row['confidence_score'],
                     "tickers": news[i].get("tickers", []),
-                    "url": news[i].get("url", "")
+                    "url": news[i].get("url", ""),
+                    "timestamp": news[i].get("timestamp", "")
                 })
-                
-        return positive
+
+        # Newest first; drop anything that has aged out of the news buffer
+        self.positive_news = [item for item in positive + self.positive_news if self.news.contains(news_key(item))]
+        return list(self.positive_news)
+
+    # Folds newly labeled headlines into the sentiment model in a background process; the updated model is
+    # swapped in when it is ready
+    def retrain_model(self):
+        self.model_loader.retrain()
+
+    # Returns (bars, error) for the chart tab, bars from the price cache when fresh. An invalid ticker, a failed
+    # download with nothing cached or an empty download gives (None, message) for the tab to show.
+    def load_chart(self, ticker):
+        try:
+            bars = self.prices.get(ticker)
+            if bars is None or bars.empty or "Close" not in bars.columns:
+                raise ValueError("No data returned")
+            return bars, None
+        except Exception as e:
+            metrics.error("chart", e)
+            print(f"⚠️ Failed to load chart: {e}")
+            return None, str(e)
+
+    # Starts downloading chart bars for the given tickers in the background
+    def prefetch_prices(self, tickers):
+        self.prices.prefetch(tickers)
+
+    # Pipeline stage timings, row counts and errors together with every cache's counters
+    def metrics_report(self):
+        return {
+            **metrics.snapshot(),
+            "caches": {
+                "finviz": cache_stats(),
+                "finviz_client": client_stats(),
+                "predictions": prediction_cache_stats(),
+                "news": dict(self.news.stats),
+                "prices": dict(self.prices.stats),
+                "momentum": dict(self.momentum.stats) if self.momentum else {},
+            },
+        }
+
+    # Writes metrics_report() to data/metrics.json and returns the path
+    def dump_metrics(self, path=METRICS_PATH):
+        return dump_metrics(self.metrics_report(), path)
+
+    # Writes any buffered log entries and drops queued price downloads; call before exiting
+    def close(self):
+        self.prime_log.close()
+        self.prices.close()
 
     # Opens a URL in the default web browser
     def open_url(self, url):
@@ -0,0 +1,103 @@
+from controller.worker import RefreshWorker
+from core.metrics import metrics
+
+# Owns one repeating timer per panel on a Tk-style root: skips a tick while the last refresh is still running,
+# backs off exponentially while the job keeps failing, and counts what it did
+class RefreshScheduler:
+    def __init__(self, root, worker=None, poll_ms=100, max_backoff_ms=300000):
+        self.root = root
+        self.worker = worker or RefreshWorker()
+        self.poll_ms = poll_ms
+        self.max_backoff_ms = max_backoff_ms
+        self.tasks = {}
+        self.timers = {}
+
+    # Registers a refresh job; on_result(result) is called on the Tk thread with each finished result.
+    # interval_ms=None registers an on-demand job that only runs through refresh_now().
+    def add(self, name, job, on_result, interval_ms, first_delay_ms=0):
+        self.tasks[name] = {
+            "job": job,
+            "on_result": on_result,
+            "interval_ms": interval_ms,
+            "first_delay_ms": first_delay_ms,
+            "running": False,
+            "failures": 0,
+            "ticks": 0,
+            "started": 0,
+            "skipped": 0,
+            "completed": 0,
+            "errors": 0,
+        }
+
+    # Starts every task timer and the result poller
+    def start(self):
+        for name, task in self.tasks.items():
+            if task["interval_ms"] is not None:
+                self._schedule(name, task["first_delay_ms"])
+        self._schedule("_poll", self.poll_ms)
+
+    # Cancels all timers and drops queued jobs
+    def stop(self):
+        for timer in self.timers.values():
+            self.root.after_cancel(timer)
+        self.timers.clear()
+        self.worker.shutdown()
+
+    # Changes a task's interval; takes effect from its next tick
+    def set_interval(self, name, interval_ms):
+        self.tasks[name]["interval_ms"] = interval_ms
+
+    # Runs a task immediately unless it is already in flight
+    def refresh_now(self, name):
+        self._start(name)
+
+    # Returns the counters for every task
+    def stats(self):
+        return {name: {k: v for k, v in task.items() if k not in ("job", "on_result")} for name, task in self.tasks.items()}
+
+    # Delay until the next tick: the interval, doubled for each consecutive failure up to the cap
+    def next_delay(self, name):
+        task = self.tasks[name]
+        if not task["failures"]:
+            return task["interval_ms"]
+        return min(self.max_backoff_ms, task["interval_ms"] * 2 ** task["failures"])
+
+    def _schedule(self, name, delay_ms):
+        callback = self._poll if name == "_poll" else lambda: self._tick(name)
+        self.timers[name] = self.root.after(delay_ms, callback)
+
+    def _tick(self, name):
+        self.tasks[name]["ticks"] += 1
+        self._start(name)
+        self._schedule(name, self.next_delay(name))
+
+    def _start(self, name):
+        task = self.tasks[name]
+        if task["running"]:
+            task["skipped"] += 1
+            return
+        task["running"] = True
+        task["started"] += 1
+        self.worker.submit(name, task["job"])
+
+    def _poll(self):
+        for name, result, error in self.worker.drain():
+            task = self.tasks[name]
+            task["running"] = False
+            if error:
+                task["errors"] += 1
+                task["failures"] += 1
+                metrics.error(f"refresh_{name}", error)
+                print(f"❌ Error refreshing {name}: {error}")
+                continue
+
+            task["completed"] += 1
+            task["failures"] = 0
+            # A failing render must not stop the poller, or every panel would freeze
+            try:
+                with metrics.time(f"render_{name}"):
+                    task["on_result"](result)
+            except Exception as e:
+                print(f"❌ Error rendering {name}: {e}")
+
+        self._schedule("_poll", self.poll_ms)
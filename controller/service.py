@@ -0,0 +1,121 @@
+import sys
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Field names for the rows Controller.get_screener_results() returns
+RESULT_FIELDS = ["Ticker", "Price", "Float", "RelVolume", "ChangePercent", "RelVolumeRate", "ChangeRate", "Target",
+                 "StopLoss", "Sentiment"]
+
+# Converts numpy scalars and missing values into plain JSON values
+def _jsonable(value):
+    if hasattr(value, "item"):
+        value = value.item()
+    try:
+        return None if value is None or value != value else value  # NaN / NaT
+    except TypeError:
+        return None  # pd.NA
+
+def _records(rows):
+    return [{field: _jsonable(value) for field, value in zip(RESULT_FIELDS, row)} for row in rows]
+
+# Runs the fetch → filter → rank → sentiment pipeline on a timer without any GUI. Each refresh is written as one
+# JSON line to the output stream and kept as the latest result for the optional HTTP endpoint. Given several
+# strategy names, each refresh ranks the same snapshot under all of them and reports them under "strategies".
+class ScreenerService:
+    def __init__(self, controller, interval=15.0, output=None, news=True, max_backoff=300.0, strategies=None):
+        self.controller = controller
+        self.strategies = strategies
+        self.interval = interval
+        self.output = output
+        self.news = news
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.latest = None
+        self.stopped = threading.Event()
+        self.server = None
+        self.stats = {"refreshes": 0, "errors": 0}
+
+    # Runs one refresh and returns its result; errors propagate so run() can back off
+    def refresh(self):
+        started = time.perf_counter()
+        result = {"timestamp": datetime.now().isoformat(timespec="seconds")}
+        if self.strategies:
+            ranked = self.controller.get_strategy_results(self.strategies)
+            result["strategies"] = {
+                name: {"prime": _records(prime), "subprime": _records(subprime)} for name, (prime, subprime) in ranked.items()
+            }
+        else:
+            prime, subprime = self.controller.get_screener_results()
+            result["prime"] = _records(prime)
+            result["subprime"] = _records(subprime)
+
+        positive = self.controller.get_positive_news() if self.news else []
+        result.update({
+            "positive_news": [{key: _jsonable(value) for key, value in item.items()} for item in positive],
+            "seconds": round(time.perf_counter() - started, 3),
+        })
+        self.latest = result
+        self.stats["refreshes"] += 1
+        if self.output:
+            self.output.write(json.dumps(result) + "\n")
+            self.output.flush()
+        return result
+
+    # Delay until the next refresh: the interval, doubled for each consecutive failure up to the cap
+    def next_delay(self):
+        if not self.failures:
+            return self.interval
+        return min(self.max_backoff, self.interval * 2 ** self.failures)
+
+    # Refreshes until stop() is called, or once when once=True
+    def run(self, once=False):
+        while not self.stopped.is_set():
+            try:
+                self.refresh()
+                self.failures = 0
+            except Exception as e:
+                self.failures += 1
+                self.stats["errors"] += 1
+                print(f"❌ Error refreshing screener: {e}", file=sys.stderr)
+            if once:
+                break
+            self.stopped.wait(self.next_delay())
+
+    # Serves GET /latest (the last refresh) and GET /stats (refresh counters plus the controller's metrics report)
+    # on a background thread; port 0 picks a free port
+    def serve(self, host="127.0.0.1", port=8765):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path in ("/", "/latest"):
+                    body = service.latest
+                elif self.path == "/stats":
+                    body = {**service.stats, **service.controller.metrics_report()}
+                else:
+                    self.send_error(404)
+                    return
+                data = json.dumps(body, default=str).encode("utf-8")
+                self.send_response(200 if body is not None else 503)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, name="service-http", daemon=True).start()
+        return self.server.server_address
+
+    # Ends run() after the current refresh and shuts the HTTP endpoint down
+    def stop(self):
+        self.stopped.set()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,33 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# Runs controller jobs on background threads and hands finished results back through a queue
+class RefreshWorker:
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="refresh")
+        self.results = queue.Queue()
+
+    # Starts fn on a worker thread; its result (or exception) is queued under the given kind
+    def submit(self, kind, fn, *args):
+        future = self.executor.submit(fn, *args)
+        future.add_done_callback(lambda f: self._finish(kind, f))
+        return future
+
+    def _finish(self, kind, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        self.results.put((kind, None if error else future.result(), error))
+
+    # Returns every finished (kind, result, error) without blocking; safe to call from the Tk main loop
+    def drain(self):
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                return finished
+
+    # Stops accepting work and drops jobs that have not started yet
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
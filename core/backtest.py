@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+from core.recorder import SNAPSHOT_DIR, list_snapshots, load_screener
+
+OUTCOMES = np.array(["target", "stop", "open", "no_data"])
+
+# Memory the per-chunk (signals x max_bars) work arrays may take, and roughly what one cell of them costs:
+# the int64 bar indices, the gathered highs and lows and the boolean masks
+CHUNK_BYTES = 16 * 1024 * 1024
+BYTES_PER_CELL = 48
+
+# Bar timestamps as naive wall-clock time, so they compare with the naive timestamps in the prime log
+def _naive(timestamps):
+    timestamps = pd.to_datetime(timestamps)
+    if getattr(timestamps.dt, "tz", None) is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps
+
+# Builds close-only price bars from recorded screener snapshots (each refresh is one bar per ticker)
+def bars_from_snapshots(root=SNAPSHOT_DIR, start=None, end=None):
+    frames = []
+    for at, path in list_snapshots("screener", root, start, end):
+        snapshot = load_screener(path)
+        price = snapshot["Price"].astype("float64")
+        frames.append(pd.DataFrame({"ticker": snapshot["Ticker"], "timestamp": at, "high": price, "low": price, "close": price}))
+    if not frames:
+        return pd.DataFrame(columns=["ticker", "timestamp", "high", "low", "close"])
+    return pd.concat(frames, ignore_index=True)
+
+# Simulates Target/StopLoss exits for every logged signal at once.
+#   signals: rows with timestamp, ticker, price, target (%), stop_loss (negative %), e.g. PrimeLog.history()
+#   bars:    rows with ticker, timestamp, high, low, close
+# Each signal enters at its logged price and is followed for up to max_bars bars after its timestamp. The first bar
+# whose high reaches the target or whose low reaches the stop closes it; a bar that touches both counts as a stop.
+# Signals that hit neither are marked "open" at the last close. Returns one row per signal.
+# Signals are processed in chunks sized so the work arrays stay within CHUNK_BYTES unless chunk_size is given.
+def backtest(signals, bars, max_bars=390, chunk_size=None):
+    signals = pd.DataFrame(signals).reset_index(drop=True)
+    bars = pd.DataFrame(bars)
+    entry = signals["price"].astype("float64").to_numpy()
+    target_price = entry * (1 + signals["target"].astype("float64").to_numpy() / 100)
+    stop_price = entry * (1 + signals["stop_loss"].astype("float64").to_numpy() / 100)
+
+    outcome = np.full(len(signals), 3)
+    exit_index = np.full(len(signals), -1)
+    starts = np.zeros(len(signals), dtype="int64")
+    exit_price = np.full(len(signals), np.nan)
+    exit_time = np.full(len(signals), np.datetime64("NaT"), dtype="datetime64[ns]")
+
+    if len(signals) and len(bars):
+        bars = bars.assign(timestamp=_naive(bars["timestamp"]))
+        bars = bars.sort_values(["ticker", "timestamp"], kind="stable").reset_index(drop=True)
+
+        tickers = pd.Index(bars["ticker"].unique())
+        bar_codes = tickers.get_indexer(bars["ticker"])
+        signal_codes = tickers.get_indexer(signals["ticker"])
+
+        # Bars are sorted by (ticker, time); pack both into one int64 key so one searchsorted finds each
+        # signal's first later bar: ticker code in the high bits, seconds since the earliest time in the low 40 bits
+        bar_seconds = bars["timestamp"].to_numpy("datetime64[s]").astype("int64")
+        signal_seconds = _naive(signals["timestamp"]).to_numpy("datetime64[s]").astype("int64")
+        origin = min(bar_seconds.min(), signal_seconds.min()) - 1
+        bar_keys = (bar_codes.astype("int64") << 40) | (bar_seconds - origin)
+        signal_keys = (np.maximum(signal_codes, 0).astype("int64") << 40) | (signal_seconds - origin)
+
+        group_ends = np.searchsorted(bar_codes, np.arange(len(tickers)), side="right")
+        starts = np.searchsorted(bar_keys, signal_keys, side="right")
+        # Tickers without bars get an empty window
+        ends = np.where(signal_codes >= 0, group_ends[np.maximum(signal_codes, 0)], starts)
+
+        high = bars["high"].to_numpy("float64")
+        low = bars["low"].to_numpy("float64")
+        close = bars["close"].to_numpy("float64")
+        offsets = np.arange(max_bars)
+        chunk_size = chunk_size or max(1, CHUNK_BYTES // (max_bars * BYTES_PER_CELL))
+
+        for lo in range(0, len(signals), chunk_size):
+            hi = min(lo + chunk_size, len(signals))
+            idx = starts[lo:hi, None] + offsets
+            valid = idx < ends[lo:hi, None]
+            idx = np.where(valid, idx, 0)
+
+            hit_target = valid & (high[idx] >= target_price[lo:hi, None])
+            hit_stop = valid & (low[idx] <= stop_price[lo:hi, None])
+            first_target = np.where(hit_target.any(axis=1), hit_target.argmax(axis=1), max_bars)
+            first_stop = np.where(hit_stop.any(axis=1), hit_stop.argmax(axis=1), max_bars)
+            bars_seen = valid.sum(axis=1)
+
+            chunk_outcome = np.select(
+                [bars_seen == 0, first_stop < max_bars, first_target < max_bars],
+                [3, 1, 0],
+                default=2
+            )
+            # A stop only wins when it came first or in the same bar as the target
+            chunk_outcome = np.where((chunk_outcome == 1) & (first_target < first_stop), 0, chunk_outcome)
+            chunk_exit = np.select(
+                [chunk_outcome == 0, chunk_outcome == 1, chunk_outcome == 2],
+                [first_target, first_stop, bars_seen - 1],
+                default=-1
+            )
+
+            outcome[lo:hi] = chunk_outcome
+            exit_index[lo:hi] = np.where(chunk_exit >= 0, starts[lo:hi] + chunk_exit, -1)
+
+        has_exit = exit_index >= 0
+        safe_exit = np.where(has_exit, exit_index, 0)
+        exit_price = np.select(
+            [outcome == 0, outcome == 1, outcome == 2],
+            [target_price, stop_price, close[safe_exit]],
+            default=np.nan
+        )
+        exit_time = np.where(has_exit, bars["timestamp"].to_numpy("datetime64[ns]")[safe_exit], exit_time)
+
+    return pd.DataFrame({
+        "timestamp": signals["timestamp"],
+        "ticker": signals["ticker"],
+        "entry": entry,
+        "outcome": OUTCOMES[outcome],
+        "exit_time": exit_time,
+        "bars_held": np.where(exit_index >= 0, exit_index - starts + 1, 0),
+        "return_pct": (exit_price / entry - 1) * 100,
+    })
+
+# Hit rates and return statistics over a backtest result
+def summarize(results):
+    traded = results[results["outcome"] != "no_data"]
+    returns = traded["return_pct"]
+    count = len(traded)
+    return {
+        "signals": len(results),
+        "traded": count,
+        "target_hit_rate": (traded["outcome"] == "target").mean() if count else 0.0,
+        "stop_hit_rate": (traded["outcome"] == "stop").mean() if count else 0.0,
+        "open_rate": (traded["outcome"] == "open").mean() if count else 0.0,
+        "win_rate": (returns > 0).mean() if count else 0.0,
+        "avg_return_pct": returns.mean() if count else 0.0,
+        "median_return_pct": returns.median() if count else 0.0,
+        "total_return_pct": returns.sum() if count else 0.0,
+        "avg_bars_held": traded["bars_held"].mean() if count else 0.0,
+    }
@@ -0,0 +1,125 @@
+import os
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from core.sentiment import MODEL_DIR, MODEL_FILES, SENTIMENT_BACKEND, load_model, train_or_load_model
+from core.recorder import SNAPSHOT_DIR, list_snapshots
+
+# Headlines per chunk sent to a worker; also bounds how much of the input is held in memory at once
+CHUNK_SIZE = 5000
+
+# Scores one chunk of headlines: one transform and one predict_proba over its distinct headlines, and TextBlob
+# polarity once per distinct headline. Returns the chunk with prediction, confidence_score and sentiment_score
+# columns added (the same values classify_headlines gives).
+def score_frame(frame, model, vectorizer, column="headline"):
+    from textblob import TextBlob
+
+    if frame.empty:
+        return frame.assign(prediction=[], confidence_score=[], sentiment_score=[])
+
+    codes, unique = pd.factorize(frame[column].fillna("").astype(str))
+    probs = model.predict_proba(vectorizer.transform(unique))
+    predictions = model.classes_[probs.argmax(axis=1)]
+    labels = np.where(predictions == 1, '📈 Positive', '📉 Negative')
+    confidences = probs.max(axis=1).round(3)
+    polarity = np.array([round(TextBlob(headline).sentiment.polarity, 3) for headline in unique])
+
+    return frame.assign(
+        prediction=labels[codes],
+        confidence_score=confidences[codes],
+        sentiment_score=polarity[codes],
+    )
+
+# Model held by each worker process, loaded (memory-mapped) once when the worker starts
+_worker_pair = None
+
+def _init_worker(backend, model_dir):
+    global _worker_pair
+    _worker_pair = load_model(backend, model_dir)
+
+def _score_chunk(frame, column):
+    return score_frame(frame, *_worker_pair, column=column)
+
+# Reads a CSV in chunks, keeping only the headline column plus any extra columns asked for
+def csv_chunks(path, column="headline", keep=(), chunk_size=CHUNK_SIZE):
+    usecols = [column, *keep]
+    yield from pd.read_csv(path, usecols=usecols, chunksize=chunk_size, encoding="utf-8")
+
+# Reads recorded news snapshots (see core/recorder.py) as chunks of at most chunk_size items
+def news_snapshot_chunks(root=SNAPSHOT_DIR, start=None, end=None, chunk_size=CHUNK_SIZE):
+    pending, size = [], 0
+    for _, path in list_snapshots("news", root, start, end):
+        frame = pd.read_parquet(path)
+        pending.append(frame)
+        size += len(frame)
+        while size >= chunk_size:
+            merged = pd.concat(pending, ignore_index=True)
+            yield merged.iloc[:chunk_size]
+            pending, size = [merged.iloc[chunk_size:]], size - chunk_size
+    if size:
+        yield pd.concat(pending, ignore_index=True)
+
+# Scores every chunk and appends the results to a Parquet file as they finish, in input order.
+# With more than one worker the chunks are spread over a process pool (each worker memory-maps the saved model);
+# at most two chunks per worker are in flight, so memory stays bounded however long the input is.
+# Returns {"rows", "chunks", "seconds"}.
+def bulk_score(chunks, output_path, column="headline", backend=None, model_dir=MODEL_DIR, workers=None,
+               compression="zstd"):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    backend = backend or SENTIMENT_BACKEND
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    stats = {"rows": 0, "chunks": 0}
+    writer = None
+    tmp_path = output_path + ".tmp"
+
+    def write(frame):
+        nonlocal writer
+        if frame.empty:
+            return
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(tmp_path, table.schema, compression=compression)
+        writer.write_table(table.cast(writer.schema))
+        stats["rows"] += len(frame)
+        stats["chunks"] += 1
+
+    # Workers load the saved files, so train the default model first if it was never saved
+    if model_dir == MODEL_DIR and not os.path.exists(os.path.join(model_dir, MODEL_FILES[backend][0])):
+        train_or_load_model(backend)
+
+    try:
+        if workers <= 1:
+            model, vectorizer = load_model(backend, model_dir)
+            for frame in chunks:
+                write(score_frame(frame, model, vectorizer, column))
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                     initargs=(backend, model_dir)) as pool:
+                in_flight = deque()
+                for frame in chunks:
+                    in_flight.append(pool.submit(_score_chunk, frame, column))
+                    if len(in_flight) >= 2 * workers:
+                        write(in_flight.popleft().result())
+                while in_flight:
+                    write(in_flight.popleft().result())
+    except BaseException:
+        # A failed run must not leave a half-written file behind
+        if writer is not None:
+            writer.close()
+            os.remove(tmp_path)
+        raise
+    if writer is not None:
+        writer.close()
+
+    if writer is None:
+        raise ValueError("No headlines to score")
+    os.replace(tmp_path, output_path)
+    stats["seconds"] = time.perf_counter() - start
+    return stats
@@ -1,125 +1,151 @@
+import numpy as np
 import pandas as pd
-from core.finviz_api import fetch_finviz_data
-
-# Converts a percentage string like '12.3%' to float 12.3
-def clean_percent(value):
-    try:
-        return float(value.strip('%'))
-    except:
-        return None
-
-# Converts a float string like '5.1M' to 5100000
-def clean_float(value):
-    try:
-        return int(value) * 1000000
-    except:
-        return None
-
-# Calculates percentage change from previous close
-def change_from_close(price, prev_close):
-    if pd.isna(price) or pd.isna(prev_close) or price == 0:
-        return '0'
-    change_pct = ((price - prev_close) / prev_close) * 100
-    return change_pct
-
-# Applies all filters to Finviz data to identify high-potential stocks
-def apply_filters(df: pd.DataFrame) -> pd.DataFrame:
-    df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
-    df["Previous Close"] = pd.to_numeric(df["Prev Close"], errors="coerce")
-    df["Change%"] = df.apply(lambda row: change_from_close(row["Price"], row["Previous Close"]), axis=1)
-    df["Rel Volume"] = pd.to_numeric(df["Relative Volume"], errors="coerce")
-    df["Float"] = df["Shares Float"].apply(clean_float)
-
+from core.strategies import DEFAULT_STRATEGY, compiled_strategies
+from core.metrics import metrics
+
+# Output record fields mapped to the screener columns they are read from
+RANKED_FIELDS = {
+    "Ticker": "Ticker",
+    "Price": "Price",
+    "Float": "Shares Float",
+    "RelVolume": "Rel Volume",
+    "ChangePercent": "Change",
+    "ShortFloat": "Short Float",
+    "Target": "Target",
+    "StopLoss": "StopLoss",
+    "RelVolumeDelta": "Rel Volume Delta",
+    "RelVolumeRate": "Rel Volume Rate",
+    "ChangeDelta": "Change% Delta",
+    "ChangeRate": "Change% Rate",
+}
+
+# Converts percentage strings like '12.3%' to 12.3, unparseable -> NaN
+def clean_percent_column(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("float64")
+    return pd.to_numeric(series.astype("string").str.strip().str.strip("%"), errors="coerce").astype("float64")
+
+# Converts share counts in millions to whole shares, unparseable -> NaN
+def clean_float_column(series: pd.Series) -> pd.Series:
+    return np.trunc(pd.to_numeric(series, errors="coerce")) * 1000000
+
+# Calculates percentage change from previous close; missing or zero prices count as 0% change
+def change_from_close_column(price: pd.Series, prev_close: pd.Series) -> pd.Series:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = ((price - prev_close) / prev_close) * 100
+    valid = price.notna() & prev_close.notna() & (price != 0)
+    return change_pct.where(valid, 0.0)
+
+# Parses an optional numeric column, keeping NaN for blanks and using the default for junk
+def _numeric_column(raw, default):
+    values = clean_percent_column(raw)
+    return values.where(values.notna() | raw.isna(), float(default))
+
+# Parses a raw Finviz export into a typed snapshot in one conversion pass; optional columns are kept only if exported.
+# Numbers stay float64, since any of them can feed a strategy rule or the price levels.
+def normalize_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.reset_index(drop=True)
+    price = pd.to_numeric(df["Price"], errors="coerce").astype("float64")
+    prev_close = pd.to_numeric(df["Prev Close"], errors="coerce").astype("float64")
+    shares_float = pd.to_numeric(df["Shares Float"], errors="coerce").astype("float64")
+
+    snapshot = pd.DataFrame({
+        "Ticker": df["Ticker"].astype("string"),
+        "Price": price,
+        "Previous Close": prev_close,
+        "Change%": change_from_close_column(price, prev_close),
+        "Rel Volume": pd.to_numeric(df["Relative Volume"], errors="coerce").astype("float64"),
+        "Shares Float": shares_float,
+        "Float": clean_float_column(shares_float).astype("Int64"),
+    })
+
+    if "Change" in df.columns:
+        snapshot["Change"] = df["Change"].astype("string")
     if "Short Float" in df.columns:
-        df["Short Float"] = df["Short Float"].apply(clean_percent)
-
-    filtered_df = df[
-        (df["Price"] >= 2) &
-        (df["Price"] <= 20) &
-        (df["Change%"] >= 10) &
-        (df["Rel Volume"] >= 5)
-    ]
-
-    if "Short Float" in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df["Short Float"] >= 5]
-
+        snapshot["Short Float"] = clean_percent_column(df["Short Float"])
+    if "Volatility (Week)" in df.columns:
+        snapshot["Volatility (Week)"] = _numeric_column(df["Volatility (Week)"], 0)
+    if "Relative Strength Index (14)" in df.columns:
+        snapshot["Relative Strength Index (14)"] = _numeric_column(df["Relative Strength Index (14)"], 50)
+
+    return snapshot
+
+# Computes a strategy's setup score (0-4 for the default screen) for every row at once
+def score_stocks(df: pd.DataFrame, strategy=DEFAULT_STRATEGY, strategies=None) -> pd.DataFrame:
+    strategies = strategies or compiled_strategies()
+    df["Score"] = strategies.scores(df)[strategy]
+    return df
+
+# Rounds to cents with half cents going away from zero. Levels come from two-decimal inputs, so half cents are
+# common and land a hair either side of .5 in binary; the nudge makes them round the same way every time.
+def _round_cents(values: pd.Series) -> pd.Series:
+    return (values + np.copysign(1e-9, values)).round(2)
+
+# Returns a snapshot column as float64, or a constant default when the export did not include it
+def _level_input(snapshot, column, default):
+    if column not in snapshot.columns:
+        return pd.Series(float(default), index=snapshot.index)
+    return snapshot[column].astype("float64")
+
+# Computes the volatility/RSI based Target and StopLoss percentages for every row at once
+def add_price_levels(snapshot: pd.DataFrame) -> pd.DataFrame:
+    vol_w = _level_input(snapshot, "Volatility (Week)", 0)
+    rsi = _level_input(snapshot, "Relative Strength Index (14)", 50)
+
+    snapshot["Target"] = _round_cents(0.7 * vol_w + 0.03 * (70 - rsi))
+    snapshot["StopLoss"] = _round_cents((0.3 * vol_w - 0.02 * (rsi - 50)) * -1)
+    return snapshot
+
+# Builds output dictionaries from the mapped columns without walking the rows
+def to_records(df: pd.DataFrame, fields: dict) -> list:
+    out = pd.DataFrame(index=df.index)
+    for key, column in fields.items():
+        if column not in df.columns:
+            out[key] = ""
+        else:
+            out[key] = df[column]
+    out["Headline"] = None
+    return out.astype(object).to_dict("records")
+
+# Applies all of a strategy's rules to a screener snapshot to identify high-potential stocks
+def apply_filters(snapshot: pd.DataFrame, strategy=DEFAULT_STRATEGY, strategies=None) -> pd.DataFrame:
+    strategies = strategies or compiled_strategies()
+    filtered_df = snapshot[strategies.masks(snapshot)[strategy]]
     return filtered_df.reset_index(drop=True)
 
-# Returns a list of filtered stock dictionaries with relevant info
-def get_filtered_stocks():
-    try:
-        df = fetch_finviz_data()
-        df = apply_filters(df)
-        stocks = []
-        for _, row in df.iterrows():
-            stocks.append({
-                "Ticker": row.get("Ticker", ""),
-                "Price": row.get("Price", ""),
-                "Float": row.get("Shares Float", ""),
-                "RelVolume": row.get("Relative Volume", ""),
-                "ChangePercent": row.get("Change", ""),
-                "Headline": None
-            })
-        return stocks
-    except Exception as e:
-        print(f"❌ Error loading Finviz screener data: {e}")
-        return []
-
-# Scores and ranks stocks as Prime or Subprime setups
-def rank_and_group_stocks():
+# Scores a screener snapshot and splits it into Prime (4/4) and Subprime (3/4) setups
+def rank_and_group_stocks(snapshot: pd.DataFrame, strategy=DEFAULT_STRATEGY, strategies=None):
+    return rank_strategies(snapshot, [strategy], strategies)[strategy]
+
+# Ranks one snapshot under several strategies at once (all configured ones by default); returns
+# {name: (prime, subprime)}. Every strategy is scored in the same pass and levels are computed once per row.
+def rank_strategies(snapshot: pd.DataFrame, names=None, strategies=None):
+    strategies = strategies or compiled_strategies()
+    names = names or strategies.names
+    unknown = [name for name in names if name not in strategies]
+    if unknown:
+        raise ValueError(f"Unknown strategy: {', '.join(unknown)} (see strategies.json)")
     try:
-        df = fetch_finviz_data()
-        df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
-        df["Previous Close"] = pd.to_numeric(df["Prev Close"], errors="coerce")
-        df["Change%"] = df.apply(lambda row: change_from_close(row["Price"], row["Previous Close"]), axis=1)
-        df["Rel Volume"] = pd.to_numeric(df["Relative Volume"], errors="coerce")
-        df["Float"] = df["Shares Float"].apply(clean_float)
-
-        if "Short Float" in df.columns:
-            df["Short Float"] = df["Short Float"].apply(clean_percent)
-        else:
-            df["Short Float"] = 0
-
-        df = df.dropna(subset=["Float"])
-
-        prime, subprime = [], []
-        for _, row in df.iterrows():
-            score = 0
-            if 2 <= row["Price"] <= 20: score += 1
-            if row["Change%"] >= 10: score += 1
-            if row["Rel Volume"] >= 5: score += 1
-            if row["Short Float"] >= 5: score += 1
-
-            try:
-                vol_w = float(str(row.get("Volatility (Week)", 0)).replace('%', ''))
-            except:
-                vol_w = 0
-            try:
-                rsi = float(row.get("Relative Strength Index (14)", 50))
-            except:
-                rsi = 50
-
-            target = round(0.7 * vol_w + 0.03 * (70 - rsi), 2)
-            stop = round((0.3 * vol_w - 0.02 * (rsi - 50)) * -1, 2)
-
-            stock_data = {
-                "Ticker": row.get("Ticker", ""),
-                "Price": row.get("Price", ""),
-                "Float": row.get("Shares Float", ""),
-                "RelVolume": row.get("Relative Volume", ""),
-                "ChangePercent": row.get("Change", ""),
-                "ShortFloat": row.get("Short Float", ""),
-                "Target": target,
-                "StopLoss": stop,
-                "Headline": None
-            }
-
-            if score == 4:
-                prime.append(stock_data)
-            elif score == 3:
-                subprime.append(stock_data)
-
-        return prime, subprime
+        df = snapshot.dropna(subset=["Float"])
+        scores = strategies.scores(df)
+
+        # Levels are only needed for rows that make the cut somewhere
+        keep = np.zeros(len(df), dtype=bool)
+        for name in names:
+            keep |= (scores[name] >= strategies[name].subprime).to_numpy()
+        df = add_price_levels(df[keep].copy())
+        scores = scores[keep]
+
+        # Rows are converted once and each strategy picks its own copies
+        records = to_records(df, RANKED_FIELDS)
+        results = {}
+        for name in names:
+            strategy, score = strategies[name], scores[name].to_numpy()
+            prime = [dict(records[i]) for i in np.flatnonzero(score >= strategy.prime)]
+            subprime = [dict(records[i]) for i in np.flatnonzero((score >= strategy.subprime) & (score < strategy.prime))]
+            results[name] = (prime, subprime)
+        return results
     except Exception as e:
+        metrics.error("rank", e)
         print(f"❌ Error ranking filtered stocks: {e}")
-        return [], []
\ No newline at end of file
+        return {name: ([], []) for name in names}
@@ -1,54 +1,286 @@
-import pandas as pd
 import requests
 import io
 import csv
+import time
+import random
+import threading
+from collections import deque
+from requests.adapters import HTTPAdapter
+from core.metrics import metrics
 
 # Replace this with your actual API token
 FINVIZ_API_KEY = "YOUR API TOKEN HERE"
 
+# Base URL of the Elite exports; point it at a local server to test without a key
+FINVIZ_BASE_URL = "https://elite.finviz.com"
+
+# Seconds a response is served from cache before the endpoint is asked again
+CACHE_TTL = {
+    "screener": 10,
+    "news": 10,
+}
+
+# Connect / read timeouts in seconds for every Finviz request
+REQUEST_TIMEOUT = (3.05, 15)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Screener export columns the pipeline reads, and how each is typed while parsing: "string", "float", or "percent"
+# ('12.3%' -> 12.3). Everything else in the export is skipped. A number column may name the value used for cells
+# that are present but do not parse (blanks stay NaN); other number columns read those as NaN.
+SCREENER_COLUMNS = {
+    "Ticker": "string",
+    "Price": "float",
+    "Prev Close": "float",
+    "Change": "string",
+    "Relative Volume": "float",
+    "Shares Float": "float",
+    "Short Float": "percent",
+    "Volatility (Week)": ("percent", 0.0),
+    "Relative Strength Index (14)": ("float", 50.0),
+}
+
+# Plain decimal numbers, as pd.to_numeric accepts them
+NUMBER_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+# Shared keep-alive session with bounded timeouts, jittered exponential backoff on 429/5xx and latency tracking
+class FinvizClient:
+    def __init__(self, timeout=REQUEST_TIMEOUT, retries=3, backoff=0.5, max_backoff=8.0):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.latencies = deque(maxlen=500)
+        self.stats = {"requests": 0, "retries": 0, "errors": 0}
+        self.lock = threading.Lock()
+
+    # Adds to the request counters and records a latency sample; requests come from several worker threads
+    def _record(self, latency=None, **counts):
+        with self.lock:
+            for key, n in counts.items():
+                self.stats[key] += n
+            if latency is not None:
+                self.latencies.append(latency)
+
+    # Sends a GET, retrying connection failures, timeouts and retryable statuses until attempts run out
+    def get(self, url, headers=None):
+        for attempt in range(self.retries + 1):
+            self._record(requests=1)
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(time.perf_counter() - start, errors=1)
+                if attempt == self.retries:
+                    raise
+                self._sleep(attempt)
+                continue
+
+            self._record(time.perf_counter() - start)
+            if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                return response
+
+            self._record(errors=1)
+            self._sleep(attempt, response.headers.get("Retry-After"))
+
+    # Waits before the next attempt: Retry-After if the server sent seconds, otherwise full-jitter backoff
+    def _sleep(self, attempt, retry_after=None):
+        self._record(retries=1)
+        cap = min(self.max_backoff, self.backoff * 2 ** attempt)
+        try:
+            delay = min(self.max_backoff, float(retry_after))
+        except (TypeError, ValueError):
+            delay = random.uniform(0, cap)
+        time.sleep(delay)
+
+    # Summarizes recent request latencies in seconds
+    def latency_stats(self):
+        with self.lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "count": len(samples),
+            "mean": sum(samples) / len(samples),
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max": samples[-1],
+        }
+
+# Keeps the last good body per endpoint and revalidates it with ETag / Last-Modified once its TTL runs out.
+# Entries and stats are shared by the screener and news worker threads, so they are only touched under `lock`.
+# Each endpoint also has its own lock held across the request, so concurrent callers of one endpoint wait for the
+# request already in flight and get its result from the cache instead of sending a second one.
+class ResponseCache:
+    def __init__(self, ttl=None, client=None):
+        self.ttl = dict(ttl or {})
+        self.client = client or FinvizClient()
+        self.entries = {}
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "stale": 0}
+        self.lock = threading.Lock()
+        self.endpoint_locks = {}
+
+    # The lock that serializes requests to one endpoint
+    def _endpoint_lock(self, name):
+        with self.lock:
+            return self.endpoint_locks.setdefault(name, threading.Lock())
+
+    # Returns the raw body (bytes) for an endpoint, from cache while fresh, otherwise from a conditional GET
+    def get(self, name, url, headers=None):
+        with self._endpoint_lock(name):
+            return self._get(name, url, headers)
+
+    # Cache lookup and conditional GET; called with the endpoint's lock held
+    def _get(self, name, url, headers):
+        with self.lock:
+            entry = self.entries.get(name)
+            now = time.monotonic()
+            if entry and now - entry["fetched_at"] < self.ttl.get(name, 0):
+                self.stats["hits"] += 1
+                return entry["content"]
+
+        request_headers = dict(headers or {})
+        if entry and entry["etag"]:
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = self.client.get(url, headers=request_headers)
+
+            if response.status_code == 304 and entry:
+                with self.lock:
+                    self.stats["not_modified"] += 1
+                    entry["fetched_at"] = now
+                return entry["content"]
+
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch {name}: {response.status_code} - {response.text}")
+        except Exception as e:
+            if not entry:
+                raise
+            # Serve the last good response rather than blanking the screen
+            with self.lock:
+                self.stats["stale"] += 1
+            metrics.error(f"{name}_fetch", e)
+            print(f"⚠️ Using cached {name} data: {e}")
+            return entry["content"]
+
+        with self.lock:
+            self.stats["misses"] += 1
+            self.entries[name] = {
+                "content": response.content,
+                "encoding": response.encoding,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": now,
+            }
+        return response.content
+
+    # Same as get, decoded with the charset the endpoint sent
+    def get_text(self, name, url, headers=None):
+        content = self.get(name, url, headers)
+        with self.lock:
+            entry = self.entries.get(name)
+        encoding = entry["encoding"] if entry else None
+        return content.decode(encoding or "utf-8", errors="replace")
+
+    # Drops cached bodies so the next call goes to the network
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+_cache = ResponseCache(CACHE_TTL, FinvizClient())
+
+# Returns hit/miss counters for the Finviz response cache
+def cache_stats():
+    with _cache.lock:
+        return dict(_cache.stats)
+
+# Returns request/retry counters and latency percentiles for the shared Finviz client
+def client_stats():
+    client = _cache.client
+    with client.lock:
+        counts = dict(client.stats)
+    return {**counts, "latency": client.latency_stats()}
+
 # Fetches live Finviz screener CSV data using the Elite export endpoint
 def fetch_finviz_data():
-    full_url = f"https://elite.finviz.com/export.ashx?v=152&f=sh_float_u20,sh_price_u20&c=1,25,26,30,31,84,42,43,49,50,52,53,55,56,57,59,60,61,64,81,86,87,65,66&auth={FINVIZ_API_KEY}"
+    full_url = f"{FINVIZ_BASE_URL}/export.ashx?v=152&f=sh_float_u20,sh_price_u20&c=1,25,26,30,31,84,42,43,49,50,52,53,55,56,57,59,60,61,64,81,86,87,65,66&auth={FINVIZ_API_KEY}"
     headers = {
         "User-Agent": "Mozilla/5.0"
     }
 
-    response = requests.get(full_url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch data: {response.status_code} - {response.text}")
+    content = _cache.get("screener", full_url, headers)
 
-    # Parse CSV response into a DataFrame
-    df = pd.read_csv(io.StringIO(response.text))
-    return df
+    # Parse the CSV bytes straight into a typed DataFrame
+    return read_screener_csv(content)
 
-# Fetches all breaking news headlines and related metadata from Finviz API
+# Converts a string column to float64 in one vectorized pass: surrounding whitespace (and '%' for percent columns)
+# is stripped, blanks become NaN and cells that still are not numbers become `invalid`
+def _parse_numbers(column, percent=False, invalid=float("nan")):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    text = pc.utf8_trim_whitespace(column)
+    if percent:
+        text = pc.utf8_trim(text, characters="%")
+    valid = pc.match_substring_regex(text, NUMBER_PATTERN)
+    numbers = pc.cast(pc.if_else(valid, text, None), pa.float64())
+    return pc.if_else(pc.invert(valid), invalid, numbers).fill_null(float("nan"))
+
+# Parses a screener export from its raw bytes with the pyarrow CSV reader, keeping only SCREENER_COLUMNS that the
+# export includes and converting numbers while parsing, so no column goes through a Python object pass
+def read_screener_csv(content, columns=SCREENER_COLUMNS):
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    header = next(csv.reader([content.split(b"\n", 1)[0].decode("utf-8-sig")]), [])
+    present = [name for name in columns if name in header]
+    table = pv.read_csv(
+        pa.py_buffer(content),
+        convert_options=pv.ConvertOptions(
+            include_columns=present,
+            column_types={name: pa.string() for name in present},
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+
+    for name in present:
+        kind, invalid = columns[name] if isinstance(columns[name], tuple) else (columns[name], float("nan"))
+        if kind != "string":
+            position = table.schema.get_field_index(name)
+            table = table.set_column(position, name, _parse_numbers(table[name], kind == "percent", invalid))
+    return table.to_pandas()
+
+# Fetches all breaking news headlines and related metadata from Finviz API.
+# Errors propagate, like the screener fetch, so the news refresh can back off.
 def fetch_all_finviz_api_news():
-    url = f'https://elite.finviz.com/news_export.ashx?v=3&auth={FINVIZ_API_KEY}'
+    url = f'{FINVIZ_BASE_URL}/news_export.ashx?v=3&auth={FINVIZ_API_KEY}'
     headers = {
         "Authorization": f"Bearer {FINVIZ_API_KEY}",
         "User-Agent": "Mozilla/5.0"
     }
 
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        csv_text = response.text
-        csv_reader = csv.DictReader(io.StringIO(csv_text))
-
-        headlines = []
-        for row in csv_reader:
-            tickers = row.get("Ticker", "").strip()
-            ticker_list = [t.strip() for t in tickers.split(",")] if tickers else []
-
-            headlines.append({
-                "headline": row.get("Title", "No title"),
-                "timestamp": row.get("Date", "Unknown time"),
-                "url": row.get("Url", ""),
-                "tickers": ticker_list
-            })
-
-        return headlines
-    except Exception as e:
-        print(f"❌ Error fetching news from Finviz API: {e}")
-        return []
+    csv_text = _cache.get_text("news", url, headers)
+    csv_reader = csv.DictReader(io.StringIO(csv_text))
+
+    headlines = []
+    for row in csv_reader:
+        tickers = row.get("Ticker", "").strip()
+        ticker_list = [t.strip() for t in tickers.split(",")] if tickers else []
+
+        headlines.append({
+            "headline": row.get("Title", "No title"),
+            "timestamp": row.get("Date", "Unknown time"),
+            "url": row.get("Url", ""),
+            "tickers": ticker_list
+        })
+
+    return headlines
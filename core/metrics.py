@@ -0,0 +1,113 @@
+import os
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+METRICS_PATH = os.path.join(BASE_DIR, "data", "metrics.json")
+
+# Upper bounds (ms) of the latency histogram buckets; anything slower lands in the last, open-ended bucket
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+# Per-stage latency histograms, row counts and errors for the refresh pipeline. Stages are timed with
+# `with metrics.time("fetch"):`, counts are the latest value of e.g. rows fetched, and errors keep the last message.
+class Metrics:
+    def __init__(self, samples=500):
+        self.samples = samples
+        self.lock = threading.Lock()
+        self.reset()
+
+    # Drops everything recorded so far
+    def reset(self):
+        with self.lock:
+            self.stages = {}
+            self.counts = {}
+            self.errors = {}
+            self.started = time.time()
+
+    # Adds one duration (seconds) to a stage's histogram and recent samples
+    def observe(self, stage, seconds):
+        ms = seconds * 1000
+        with self.lock:
+            entry = self.stages.get(stage)
+            if entry is None:
+                entry = self.stages[stage] = {
+                    "histogram": [0] * (len(BUCKETS_MS) + 1), "recent": deque(maxlen=self.samples), "count": 0, "total": 0.0
+                }
+            bucket = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+            entry["histogram"][bucket] += 1
+            entry["recent"].append(ms)
+            entry["count"] += 1
+            entry["total"] += ms
+
+    # Times the enclosed block as one sample of the stage; a raised exception is counted as an error of the stage
+    @contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.error(stage, e)
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    # Records the latest value of a count, e.g. rows in the last snapshot
+    def count(self, name, value):
+        with self.lock:
+            entry = self.counts.setdefault(name, {"last": 0, "total": 0, "max": 0})
+            entry["last"] = value
+            entry["total"] += value
+            entry["max"] = max(entry["max"], value)
+
+    # Counts a failure of a stage and keeps its message
+    def error(self, stage, error):
+        with self.lock:
+            entry = self.errors.setdefault(stage, {"count": 0, "last": "", "at": None})
+            entry["count"] += 1
+            entry["last"] = str(error)
+            entry["at"] = datetime.now().isoformat(timespec="seconds")
+
+    # Summarizes one stage: sample count, mean over all samples, percentiles over recent ones, and the histogram
+    def stage_stats(self, stage):
+        with self.lock:
+            entry = self.stages[stage]
+            recent = sorted(entry["recent"])
+            histogram = list(entry["histogram"])
+            count, total = entry["count"], entry["total"]
+        labels = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            "count": count,
+            "mean_ms": total / count,
+            "p50_ms": recent[len(recent) // 2],
+            "p95_ms": recent[min(len(recent) - 1, int(len(recent) * 0.95))],
+            "max_ms": recent[-1],
+            "histogram": {label: n for label, n in zip(labels, histogram) if n},
+        }
+
+    # Everything recorded, as plain data
+    def snapshot(self):
+        with self.lock:
+            stages = list(self.stages)
+            counts = {name: dict(entry) for name, entry in self.counts.items()}
+            errors = {name: dict(entry) for name, entry in self.errors.items()}
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "stages": {stage: self.stage_stats(stage) for stage in stages},
+            "counts": counts,
+            "errors": errors,
+        }
+
+# Shared pipeline metrics
+metrics = Metrics()
+
+# Writes a metrics report (the shared metrics unless one is given) as JSON; returns the path
+def dump_metrics(report=None, path=METRICS_PATH):
+    report = {"generated": datetime.now().isoformat(timespec="seconds"), **(report or metrics.snapshot())}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+    return path
@@ -0,0 +1,130 @@
+import time
+import numpy as np
+import pandas as pd
+
+# Snapshot columns whose recent history is kept per ticker
+MOMENTUM_COLUMNS = ["Price", "Rel Volume", "Change%"]
+
+# Refreshes kept per ticker (30 minutes at the 15 s screener refresh) and tickers tracked at once
+HISTORY_LENGTH = 120
+MAX_TICKERS = 5000
+
+# Seconds back that deltas are measured over; until that much history exists the oldest refresh is used
+MOMENTUM_WINDOW = 60
+
+# Fixed-size ring buffer of recent snapshots: one (refreshes x tickers) float32 array per tracked column, written one
+# row per refresh, so memory stays the same however long the session runs. Each ticker owns a column; when all are
+# taken, the tickers seen least recently give theirs up. update() adds "<column> Delta" (change over the window) and
+# "<column> Rate" (change per minute) columns to the snapshot, for strategy rules and the screener tables.
+class MomentumTracker:
+    def __init__(self, columns=MOMENTUM_COLUMNS, length=HISTORY_LENGTH, max_tickers=MAX_TICKERS,
+                 window=MOMENTUM_WINDOW, clock=time.time):
+        self.columns = list(columns)
+        self.length = length
+        self.max_tickers = max_tickers
+        self.window = window
+        self.clock = clock
+        self.values = {column: np.full((length, max_tickers), np.nan, dtype="float32") for column in self.columns}
+        self.times = np.full(length, np.nan)
+        self.last_seen = np.full(max_tickers, -np.inf)
+        self.owners = np.empty(max_tickers, dtype=object)
+        self.slots = {}
+        self.last_tickers = None
+        self.last_slots = None
+        self.refreshes = 0
+        self.stats = {"refreshes": 0, "tracked": 0, "evicted": 0, "untracked": 0}
+
+    # Gives unseen tickers a column, reusing the least recently seen ones that are not in this snapshot
+    def _assign(self, tickers, known):
+        new = pd.unique(tickers[~known])
+        if not len(new):
+            return
+        spare = np.ones(self.max_tickers, dtype=bool)
+        spare[self.ticker_slots(tickers[known])] = False
+        candidates = np.flatnonzero(spare)
+        taken = candidates[np.argsort(self.last_seen[candidates], kind="stable")][:len(new)]
+
+        for slot in taken:
+            owner = self.owners[slot]
+            if owner is not None:
+                del self.slots[owner]
+                self.stats["evicted"] += 1
+        for values in self.values.values():
+            values[:, taken] = np.nan
+        self.owners[taken] = new[:len(taken)]
+        self.slots.update(zip(new[:len(taken)], taken.tolist()))
+
+    # Buffer columns of the given tickers; -1 for tickers that have none
+    def ticker_slots(self, tickers):
+        return pd.Series(tickers, dtype=object).map(self.slots).fillna(-1).to_numpy(dtype="int64")
+
+    # Maps a snapshot's tickers to buffer columns, giving new tickers one. Refreshes usually list the same tickers
+    # as the last one, so that mapping is reused when every ticker in it already has a column.
+    def _snapshot_slots(self, tickers):
+        if self.last_tickers is not None and np.array_equal(tickers, self.last_tickers):
+            return self.last_slots
+        known = self.ticker_slots(tickers) >= 0
+        self._assign(tickers, known)
+        slots = self.ticker_slots(tickers)
+        self.stats["untracked"] = int((slots < 0).sum())
+        if (slots >= 0).all():
+            self.last_tickers, self.last_slots = tickers, slots
+        else:
+            self.last_tickers = self.last_slots = None
+        return slots
+
+    # The refresh to measure deltas against: the newest one at least `window` seconds old, else the oldest one kept
+    def _baseline(self, row, now):
+        kept = np.flatnonzero(~np.isnan(self.times))
+        kept = kept[kept != row]
+        if not len(kept):
+            return None
+        old = kept[self.times[kept] <= now - self.window]
+        return old[np.argmax(self.times[old])] if len(old) else kept[np.argmin(self.times[kept])]
+
+    # Stores one snapshot and returns it with Delta and Rate columns added (NaN where a ticker has no earlier value)
+    def update(self, snapshot, at=None):
+        now = self.clock() if at is None else at
+        tickers = snapshot["Ticker"].astype(str).to_numpy(dtype=object)
+        slots = self._snapshot_slots(tickers)
+        tracked = slots >= 0
+
+        row = self.refreshes % self.length
+        self.times[row] = now
+        self.last_seen[slots[tracked]] = now
+        for column in self.columns:
+            self.values[column][row] = np.nan
+            if column in snapshot.columns:
+                self.values[column][row, slots[tracked]] = snapshot[column].to_numpy(dtype="float32", na_value=np.nan)[tracked]
+        self.refreshes += 1
+        self.stats.update(refreshes=self.refreshes, tracked=len(self.slots))
+
+        baseline = self._baseline(row, now)
+        features = {}
+        for column in self.columns:
+            delta = np.full(len(snapshot), np.nan, dtype="float32")
+            rate = np.full(len(snapshot), np.nan, dtype="float32")
+            if baseline is not None and column in snapshot.columns:
+                values = self.values[column]
+                delta[tracked] = values[row, slots[tracked]] - values[baseline, slots[tracked]]
+                minutes = (now - self.times[baseline]) / 60
+                if minutes > 0:
+                    rate = delta / np.float32(minutes)
+            # Widened before rounding so rules compare against 0.2, not float32's 0.19999999
+            features[f"{column} Delta"] = delta.astype("float64").round(2)
+            features[f"{column} Rate"] = rate.astype("float64").round(2)
+        return pd.concat([snapshot, pd.DataFrame(features, index=snapshot.index)], axis=1)
+
+    # One ticker's kept history, oldest first, with a time column in epoch seconds
+    def history(self, ticker):
+        order = np.roll(np.arange(self.length), -(self.refreshes % self.length))
+        order = order[~np.isnan(self.times[order])]
+        slot = self.slots.get(ticker)
+        frame = pd.DataFrame({"time": self.times[order]})
+        for column in self.columns:
+            frame[column] = np.nan if slot is None else self.values[column][order, slot]
+        return frame
+
+    # Bytes held by the ring buffers; fixed when the tracker is built
+    def nbytes(self):
+        return sum(values.nbytes for values in self.values.values()) + self.times.nbytes + self.last_seen.nbytes
@@ -0,0 +1,103 @@
+import threading
+from collections import deque
+from core.finviz_api import fetch_all_finviz_api_news
+
+# Identity of a news item for deduplication: its URL, or its timestamp + headline when there is no URL
+def news_key(item):
+    return item.get("url") or (item.get("timestamp"), item.get("headline"))
+
+# Maps each ticker to its newest headlines so a stock is matched to news with one dict lookup
+class NewsIndex:
+    def __init__(self, items=(), per_ticker=3):
+        self.per_ticker = per_ticker
+        self.by_ticker = {}
+        self.add(items)
+
+    # Indexes a batch of news items given newest-first (the Finviz feed order); the batch counts as newer than
+    # anything already indexed
+    def add(self, items):
+        for item in reversed(list(items)):
+            for ticker in item.get("tickers", []):
+                bucket = self.by_ticker.get(ticker)
+                if bucket is None:
+                    bucket = self.by_ticker[ticker] = deque(maxlen=self.per_ticker)
+                bucket.appendleft(item)
+
+    # Drops an item from every ticker bucket it was indexed under
+    def remove(self, item):
+        for ticker in item.get("tickers", []):
+            bucket = self.by_ticker.get(ticker)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(item)
+            except ValueError:
+                continue
+            if not bucket:
+                del self.by_ticker[ticker]
+
+    # Returns the newest news items for a ticker, newest first
+    def latest(self, ticker):
+        return list(self.by_ticker.get(ticker, ()))
+
+    # Returns the newest headline for a ticker, or ""
+    def headline(self, ticker):
+        bucket = self.by_ticker.get(ticker)
+        return bucket[0].get("headline", "") if bucket else ""
+
+    def __len__(self):
+        return len(self.by_ticker)
+
+# Polls the news export and keeps a bounded ring buffer of unique items; each poll returns only the new ones
+class NewsIngester:
+    def __init__(self, fetch=fetch_all_finviz_api_news, max_items=2000, per_ticker=3):
+        self.fetch = fetch
+        self.items = deque()
+        self.max_items = max_items
+        self.keys = set()
+        self.index = NewsIndex(per_ticker=per_ticker)
+        self.lock = threading.Lock()
+        self.stats = {"polls": 0, "received": 0, "new": 0, "evicted": 0}
+
+    # Fetches the feed and merges unseen items; returns them newest first
+    def poll(self):
+        batch = self.fetch()
+        with self.lock:
+            self.stats["polls"] += 1
+            self.stats["received"] += len(batch)
+            fresh = []
+            for item in batch:
+                key = news_key(item)
+                if key not in self.keys:
+                    self.keys.add(key)
+                    fresh.append(item)
+
+            # Buffer runs oldest -> newest; the feed is newest first
+            self.items.extend(reversed(fresh))
+            self.index.add(fresh)
+            while len(self.items) > self.max_items:
+                old = self.items.popleft()
+                self.keys.discard(news_key(old))
+                self.index.remove(old)
+                self.stats["evicted"] += 1
+
+            self.stats["new"] += len(fresh)
+            return fresh
+
+    # Returns every buffered item, newest first
+    def newest(self):
+        with self.lock:
+            return list(reversed(self.items))
+
+    # Returns the newest headline mentioning the ticker, or ""
+    def headline(self, ticker):
+        with self.lock:
+            return self.index.headline(ticker)
+
+    # Whether an item with this key is still in the buffer
+    def contains(self, key):
+        with self.lock:
+            return key in self.keys
+
+    def __len__(self):
+        return len(self.items)
@@ -0,0 +1,179 @@
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PRICE_CACHE_DIR = os.path.join(BASE_DIR, "data", "prices")
+
+# Seconds downloaded bars are reused before the source is asked again
+PRICE_TTL = 300
+
+# Cached files older than this (seconds) are deleted when the cache is opened; younger expired files still serve
+# as a fallback when a download fails
+PRICE_KEEP = 7 * 24 * 3600
+
+# What the chart tab shows
+CHART_PERIOD = "5d"
+CHART_INTERVAL = "30m"
+
+BAR_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Tickers the cache accepts; they become file names, so nothing else (e.g. "../") is let through
+TICKER_PATTERN = re.compile(r"[A-Z0-9.\-]+")
+
+# Downloads intraday bars for one ticker from Yahoo Finance
+def yfinance_bars(ticker, period=CHART_PERIOD, interval=CHART_INTERVAL):
+    import pandas as pd
+    import yfinance as yf
+
+    df = yf.download(ticker, period=period, interval=interval, progress=False, threads=False)
+    # Newer yfinance versions label single-ticker columns as (field, ticker)
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    return df[[c for c in BAR_COLUMNS if c in df.columns]]
+
+# Price bars keyed by (ticker, period, interval), kept in memory and as Parquet files so they survive restarts.
+# Entries older than the TTL are downloaded again; prefetch() fills the cache on a small thread pool and a get()
+# for a ticker that is already downloading waits for that download instead of starting another.
+class PriceCache:
+    def __init__(self, source=yfinance_bars, root=PRICE_CACHE_DIR, ttl=PRICE_TTL, keep=PRICE_KEEP, max_workers=4):
+        self.source = source
+        self.root = root
+        self.ttl = ttl
+        self.entries = {}
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prices")
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stale": 0, "errors": 0}
+        self.evict(keep)
+
+    # Builds the cache key for a ticker, rejecting anything that is not a plain symbol
+    def _key(self, ticker, period, interval):
+        ticker = ticker.strip().upper()
+        if not TICKER_PATTERN.fullmatch(ticker):
+            raise ValueError(f"Invalid ticker: {ticker!r}")
+        return (ticker, period, interval)
+
+    def _path(self, key):
+        return os.path.join(self.root, "_".join(key) + ".parquet")
+
+    def _fresh(self, entry):
+        return entry is not None and time.time() - entry["fetched_at"] < self.ttl
+
+    # The cached entry for a key, read from disk on first use. The file is read without holding the lock, so
+    # other threads' lookups do not wait on the disk.
+    def _entry(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+        path = self._path(key)
+        if entry is None and os.path.exists(path):
+            import pandas as pd
+            try:
+                loaded = {"bars": pd.read_parquet(path), "fetched_at": os.path.getmtime(path)}
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable price cache {path}: {e}")
+                return None
+            with self.lock:
+                entry = self.entries.setdefault(key, loaded)
+                self.stats["disk_hits"] += 1
+        return entry
+
+    # Returns bars for a ticker, downloading them if the cached copy is missing or expired
+    def get(self, ticker, period=CHART_PERIOD, interval=CHART_INTERVAL):
+        key = self._key(ticker, period, interval)
+        entry = self._entry(key)
+        with self.lock:
+            entry = self.entries.get(key, entry)
+            if self._fresh(entry):
+                self.stats["hits"] += 1
+                return entry["bars"]
+            future = self.inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self.inflight[key] = Future()
+
+        if owner:
+            self._fetch(key, future)
+        try:
+            return future.result()
+        except Exception as e:
+            if entry is None:
+                raise
+            # Serve the last download rather than showing nothing
+            self.stats["stale"] += 1
+            print(f"⚠️ Using cached {key[0]} prices: {e}")
+            return entry["bars"]
+
+    # Starts background loads for every valid ticker without fresh bars in memory; returns immediately.
+    # Cached files are read on the pool too, and only expired or missing bars are downloaded.
+    def prefetch(self, tickers, period=CHART_PERIOD, interval=CHART_INTERVAL):
+        keys = []
+        for ticker in tickers:
+            try:
+                keys.append(self._key(ticker, period, interval))
+            except (AttributeError, ValueError):
+                continue
+
+        futures = []
+        with self.lock:
+            for key in dict.fromkeys(keys):
+                if key in self.inflight or self._fresh(self.entries.get(key)):
+                    continue
+                future = self.inflight[key] = Future()
+                self.executor.submit(self._load, key, future)
+                futures.append(future)
+        return futures
+
+    # Resolves a prefetch from the cached file when it is still fresh, otherwise downloads
+    def _load(self, key, future):
+        entry = self._entry(key)
+        if self._fresh(entry):
+            with self.lock:
+                self.inflight.pop(key, None)
+            future.set_result(entry["bars"])
+        else:
+            self._fetch(key, future)
+
+    # Downloads and stores one key, resolving the future that get() / prefetch() callers wait on
+    def _fetch(self, key, future):
+        self.stats["misses"] += 1
+        try:
+            bars = self.source(*key)
+            if bars is None or bars.empty:
+                raise ValueError("No data returned")
+
+            os.makedirs(self.root, exist_ok=True)
+            path = self._path(key)
+            bars.to_parquet(path + ".tmp")
+            os.replace(path + ".tmp", path)
+            with self.lock:
+                self.entries[key] = {"bars": bars, "fetched_at": time.time()}
+                self.inflight.pop(key, None)
+            future.set_result(bars)
+        except Exception as e:
+            self.stats["errors"] += 1
+            with self.lock:
+                self.inflight.pop(key, None)
+            future.set_exception(e)
+
+    # Deletes cached files older than max_age seconds (default: the TTL)
+    def evict(self, max_age=None):
+        max_age = self.ttl if max_age is None else max_age
+        if not os.path.isdir(self.root):
+            return 0
+        removed = 0
+        now = time.time()
+        with self.lock:
+            for name in os.listdir(self.root):
+                path = os.path.join(self.root, name)
+                if name.endswith(".parquet") and now - os.path.getmtime(path) >= max_age:
+                    os.remove(path)
+                    removed += 1
+            self.entries = {key: entry for key, entry in self.entries.items() if now - entry["fetched_at"] < max_age}
+        return removed
+
+    # Drops queued downloads; call on shutdown
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,135 @@
+import os
+import time
+from datetime import datetime
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SNAPSHOT_DIR = os.path.join(BASE_DIR, "data", "snapshots")
+
+# Set to True to store every screener snapshot and every new news item while the app runs
+RECORD_SNAPSHOTS = False
+
+NEWS_COLUMNS = ["headline", "timestamp", "url", "tickers"]
+
+# Writes normalized screener snapshots and news deltas as zstd-compressed Parquet files partitioned by date:
+# <root>/<kind>/date=YYYY-MM-DD/HHMMSSffffff.parquet
+class SnapshotRecorder:
+    def __init__(self, root=SNAPSHOT_DIR, compression="zstd"):
+        self.root = root
+        self.compression = compression
+        self.last_screener_hash = None
+        self.stats = {"screener": 0, "news": 0, "unchanged": 0}
+
+    def _path(self, kind, at):
+        folder = os.path.join(self.root, kind, f"date={at.date().isoformat()}")
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, at.strftime("%H%M%S%f") + ".parquet")
+
+    # Stores a typed screener snapshot; a snapshot identical to the previous one (e.g. a cache hit) is skipped
+    def record_screener(self, snapshot, at=None):
+        import pandas as pd
+        digest = int(pd.util.hash_pandas_object(snapshot, index=False).sum())
+        if digest == self.last_screener_hash:
+            self.stats["unchanged"] += 1
+            return None
+        self.last_screener_hash = digest
+
+        path = self._path("screener", at or datetime.now())
+        snapshot.to_parquet(path, compression=self.compression, index=False)
+        self.stats["screener"] += 1
+        return path
+
+    # Stores news items that arrived since the last poll
+    def record_news(self, items, at=None):
+        if not items:
+            return None
+        import pandas as pd
+        frame = pd.DataFrame([{**{c: item.get(c, "") for c in NEWS_COLUMNS}, "tickers": ",".join(item.get("tickers", []))}
+                              for item in items], columns=NEWS_COLUMNS)
+        path = self._path("news", at or datetime.now())
+        frame.to_parquet(path, compression=self.compression, index=False)
+        self.stats["news"] += 1
+        return path
+
+# Lists recorded files of one kind as (recorded_at, path), oldest first, optionally limited to a date range
+def list_snapshots(kind, root=SNAPSHOT_DIR, start=None, end=None):
+    base = os.path.join(root, kind)
+    if not os.path.isdir(base):
+        return []
+
+    found = []
+    for partition in sorted(os.listdir(base)):
+        day = partition.removeprefix("date=")
+        if (start and day < start) or (end and day > end):
+            continue
+        for name in sorted(os.listdir(os.path.join(base, partition))):
+            if name.endswith(".parquet"):
+                at = datetime.strptime(day + name[:-len(".parquet")], "%Y-%m-%d%H%M%S%f")
+                found.append((at, os.path.join(base, partition, name)))
+    return found
+
+# Reads a recorded screener snapshot back with its original dtypes
+def load_screener(path):
+    import pandas as pd
+    return pd.read_parquet(path)
+
+# Reads recorded news items back into the dicts the news layer uses
+def load_news(path):
+    import pandas as pd
+    frame = pd.read_parquet(path)
+    return [
+        {
+            "headline": row["headline"],
+            "timestamp": row["timestamp"],
+            "url": row["url"],
+            "tickers": row["tickers"].split(",") if row["tickers"] else []
+        }
+        for row in frame.to_dict("records")
+    ]
+
+# Steps through recorded snapshots on a virtual clock. screener() and news() stand in for the live fetches,
+# so a Controller built on them reproduces the recorded refreshes.
+class ReplayFeed:
+    def __init__(self, root=SNAPSHOT_DIR, start=None, end=None):
+        self.screener_files = list_snapshots("screener", root, start, end)
+        self.news_files = list_snapshots("news", root, start, end)
+        self.position = -1
+        self.news_position = 0
+        self.now = None
+
+    def __len__(self):
+        return len(self.screener_files)
+
+    # Moves the clock to the next recorded screener snapshot; returns its time, or None when done
+    def advance(self):
+        self.position += 1
+        if self.position >= len(self.screener_files):
+            return None
+        self.now = self.screener_files[self.position][0]
+        return self.now
+
+    # The screener snapshot at the current replay time
+    def screener(self):
+        return load_screener(self.screener_files[self.position][1])
+
+    # News recorded up to the current replay time that has not been handed out yet, newest first
+    def news(self):
+        items = []
+        if self.now is None:
+            return items
+        while self.news_position < len(self.news_files) and self.news_files[self.news_position][0] <= self.now:
+            items = load_news(self.news_files[self.news_position][1]) + items
+            self.news_position += 1
+        return items
+
+# Replays every recorded refresh through the controller, yielding (recorded_at, prime, subprime, positive_news).
+# speed=None runs as fast as possible; otherwise recorded gaps are slept through divided by speed.
+def replay(feed, controller, speed=None):
+    previous = None
+    while (at := feed.advance()) is not None:
+        if speed and previous:
+            time.sleep(max(0.0, (at - previous).total_seconds() / speed))
+        previous = at
+
+        prime, subprime = controller.get_screener_results()
+        positive = controller.get_positive_news()
+        yield at, prime, subprime, positive
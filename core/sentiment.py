@@ -1,28 +1,163 @@
-import pandas as pd
-import joblib
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
-from textblob import TextBlob
+import os
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from core.metrics import metrics
 
-# Paths to model, vectorizer, and labeled training data
-MODEL_PATH = "ScreenerProject/model/sentiment_model.pkl"
-VECTORIZER_PATH = "ScreenerProject/model/sentiment_vectorizer.pkl"
-LABELED_DATA_PATH = "ScreenerProject/data/labeled_data.csv"
+# Paths to model, vectorizer, and labeled training data, resolved from the project root
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+MODEL_DIR = os.path.join(BASE_DIR, "model")
+MODEL_PATH = os.path.join(MODEL_DIR, "sentiment_model.pkl")
+VECTORIZER_PATH = os.path.join(MODEL_DIR, "sentiment_vectorizer.pkl")
+MANIFEST_PATH = os.path.join(MODEL_DIR, "manifest.json")
+LABELED_DATA_PATH = os.path.join(BASE_DIR, "data", "labeled_data.csv")
+
+# Inference backend: "forest" (TF-IDF + RandomForest) or "hashed" (stateless hashing features + linear model,
+# much smaller and faster to load with comparable accuracy on labeled_data.csv, and retrained incrementally).
+# The SENTIMENT_BACKEND environment variable picks one without editing this file.
+SENTIMENT_BACKEND = os.environ.get("SENTIMENT_BACKEND", "forest")
+
+# Artifact file names per backend, inside MODEL_DIR
+MODEL_FILES = {
+    "forest": ("sentiment_model.pkl", "sentiment_vectorizer.pkl"),
+    "hashed": ("sentiment_model_hashed.pkl", "sentiment_vectorizer_hashed.pkl"),
+}
+
+# Bounded LRU (with optional TTL) of per-headline results, keyed by model version + headline hash.
+# Seeing a new model version drops everything cached for the old one.
+class PredictionCache:
+    def __init__(self, max_size=50000, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version = None
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def key(headline):
+        return hashlib.blake2b(headline.encode("utf-8"), digest_size=16).digest()
+
+    def _check_version(self, version):
+        if version != self.version:
+            if self.version is not None:
+                self.stats["invalidations"] += 1
+            self.entries.clear()
+            self.version = version
+
+    # Returns the cached entry for a headline under this model version, or None
+    def get(self, version, headline):
+        key = self.key(headline)
+        with self.lock:
+            self._check_version(version)
+            item = self.entries.get(key)
+            if item is not None and self.ttl is not None and time.monotonic() - item[0] > self.ttl:
+                del self.entries[key]
+                item = None
+            if item is None:
+                self.stats["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return item[1]
+
+    def put(self, version, headline, entry):
+        key = self.key(headline)
+        with self.lock:
+            self._check_version(version)
+            self.entries[key] = (time.monotonic(), entry)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    # Returns hit/miss counters, the hit rate and the current size
+    def summary(self):
+        with self.lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {**self.stats, "hit_rate": self.stats["hits"] / lookups if lookups else 0.0, "size": len(self.entries)}
+
+_prediction_cache = PredictionCache()
+_model_versions = weakref.WeakKeyDictionary()
+
+# Returns a token that changes whenever a different model object is in use, e.g. after a retrain
+def model_version(model):
+    return _model_versions.setdefault(model, uuid.uuid4().hex)
+
+# Returns hit-rate statistics for the headline prediction cache
+def prediction_cache_stats():
+    return _prediction_cache.summary()
+
+# Returns one cached {"label", "confidence"} entry per headline; only uncached headlines reach the model
+def _predict_entries(headlines, model, vectorizer):
+    version = model_version(model)
+    entries = [_prediction_cache.get(version, headline) for headline in headlines]
+    missing = list(dict.fromkeys(h for h, entry in zip(headlines, entries) if entry is None))
+    if not missing:
+        return entries
+
+    # predict() is just the argmax of predict_proba(), so one call gives both
+    prediction_probs = model.predict_proba(vectorizer.transform(missing))
+    predictions = model.classes_[prediction_probs.argmax(axis=1)]
+    confidences = prediction_probs.max(axis=1).round(3)
+
+    fresh = {}
+    for headline, prediction, confidence in zip(missing, predictions, confidences.tolist()):
+        fresh[headline] = {
+            "label": '📈 Positive' if prediction == 1 else '📉 Negative',
+            "confidence": confidence
+        }
+        _prediction_cache.put(version, headline, fresh[headline])
+
+    return [entry if entry is not None else fresh[h] for h, entry in zip(headlines, entries)]
+
+# Scores all headlines with at most one transform and one predict_proba; returns parallel lists of labels and confidences
+def predict_headlines(headlines, model, vectorizer):
+    if not headlines:
+        return [], []
+
+    entries = _predict_entries(headlines, model, vectorizer)
+    return [entry["label"] for entry in entries], [entry["confidence"] for entry in entries]
+
+# Classifies one headline per ticker in a single model call; returns {ticker: "📈 Positive (87%)"}
+def classify_tickers(ticker_headlines, model, vectorizer):
+    unique_headlines = list(dict.fromkeys(ticker_headlines.values()))
+    labels, confidences = predict_headlines(unique_headlines, model, vectorizer)
+    sentiment = {
+        headline: f"{label} ({int(confidence * 100)}%)"
+        for headline, label, confidence in zip(unique_headlines, labels, confidences)
+    }
+    return {ticker: sentiment[headline] for ticker, headline in ticker_headlines.items()}
 
 # Classifies a list of headlines using trained model and returns predictions + sentiment score
 def classify_headlines(headlines, model, vectorizer):
+    import pandas as pd
+    from textblob import TextBlob
+
     if not headlines:
         return pd.DataFrame()
-    
-    X_vec = vectorizer.transform(headlines)
-    predictions = model.predict(X_vec)
-    prediction_probs = model.predict_proba(X_vec)
+
+    entries = _predict_entries(headlines, model, vectorizer)
 
     results = []
-    for i, headline in enumerate(headlines):
-        sentiment_score = TextBlob(headline).sentiment.polarity
-        confidence = round(max(prediction_probs[i]), 3)
-        label = '📈 Positive' if predictions[i] == 1 else '📉 Negative'
+    for headline, entry in zip(headlines, entries):
+        # TextBlob polarity is memoized on the cached entry alongside the prediction
+        if "polarity" not in entry:
+            entry["polarity"] = TextBlob(headline).sentiment.polarity
+        sentiment_score = entry["polarity"]
+        confidence = entry["confidence"]
+        label = entry["label"]
 
         results.append({
             'headline': headline,
@@ -33,27 +168,210 @@ def classify_headlines(headlines, model, vectorizer):
 
     return pd.DataFrame(results)
 
-# Trains a new RandomForest model using labeled headline data
-def train_model():
-    df = pd.read_csv(LABELED_DATA_PATH, encoding='utf-8')
+# Trains a new model using labeled headline data (labeled_data.csv unless a frame is given);
+# RandomForest by default, or the hashed linear backend
+def train_model(backend="forest", df=None):
+    import pandas as pd
+    from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import SGDClassifier
+
+    if df is None:
+        df = pd.read_csv(LABELED_DATA_PATH, encoding='utf-8')
     X = df['headline']
     y = df['price_movement']
 
-    vectorizer = TfidfVectorizer(stop_words='english')
-    X_vec = vectorizer.fit_transform(X)
+    if backend == "hashed":
+        vectorizer = HashingVectorizer(n_features=2 ** 18, ngram_range=(1, 2), alternate_sign=False)
+        model = SGDClassifier(loss="log_loss", random_state=42)
+    else:
+        vectorizer = TfidfVectorizer(stop_words='english')
+        model = RandomForestClassifier(n_estimators=100, random_state=42)
 
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    X_vec = vectorizer.fit_transform(X)
     model.fit(X_vec, y)
 
+    if backend == "hashed":
+        # Most of the 2**18 hashed weights are zero; sparse coefficients shrink the artifact ~15x
+        model.sparsify()
+
+    return model, vectorizer
+
+# Returns the sha256 of a file, read in chunks
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Reads the artifact manifest: {backend: {"version", "files", "created"}}
+def read_manifest(model_dir=MODEL_DIR):
+    try:
+        with open(os.path.join(model_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+# Saves model artifacts uncompressed (so they can be memory-mapped) and records their hashes in the manifest,
+# along with how many labeled rows the model has seen
+def save_model(model, vectorizer, backend="forest", model_dir=MODEL_DIR, trained_rows=None):
+    import joblib
+
+    os.makedirs(model_dir, exist_ok=True)
+    model_file, vectorizer_file = MODEL_FILES[backend]
+
+    # Write beside the live files and rename over them, so a concurrent load never sees a partial pickle
+    for obj, name in ((model, model_file), (vectorizer, vectorizer_file)):
+        joblib.dump(obj, os.path.join(model_dir, name + ".tmp"))
+    for name in (model_file, vectorizer_file):
+        os.replace(os.path.join(model_dir, name + ".tmp"), os.path.join(model_dir, name))
+
+    files = {name: _file_hash(os.path.join(model_dir, name)) for name in (model_file, vectorizer_file)}
+    manifest = read_manifest(model_dir)
+    manifest[backend] = {
+        "version": hashlib.sha256("".join(files.values()).encode("utf-8")).hexdigest()[:16],
+        "files": files,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "trained_rows": trained_rows,
+    }
+
+    tmp_path = os.path.join(model_dir, "manifest.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(model_dir, "manifest.json"))
+
+    _model_versions[model] = manifest[backend]["version"]
+    return manifest[backend]
+
+# Loads saved artifacts with numpy arrays memory-mapped (read-only) unless mmap=False;
+# verify=True re-hashes the files against the manifest
+def load_model(backend="forest", model_dir=MODEL_DIR, verify=False, mmap=True):
+    import joblib
+
+    model_file, vectorizer_file = MODEL_FILES[backend]
+    entry = read_manifest(model_dir).get(backend)
+
+    if verify and entry:
+        for name, expected in entry["files"].items():
+            if _file_hash(os.path.join(model_dir, name)) != expected:
+                raise ValueError(f"{name} does not match the model manifest")
+
+    mmap_mode = "r" if mmap else None
+    model = joblib.load(os.path.join(model_dir, model_file), mmap_mode=mmap_mode)
+    vectorizer = joblib.load(os.path.join(model_dir, vectorizer_file), mmap_mode=mmap_mode)
+
+    # Key cached predictions by artifact content, so the same files keep the same version across restarts
+    if entry:
+        _model_versions[model] = entry["version"]
     return model, vectorizer
 
 # Loads the model and vectorizer from disk or trains new ones if not found
-def train_or_load_model():
+def train_or_load_model(backend=None):
+    backend = backend or SENTIMENT_BACKEND
     try:
-        model = joblib.load(MODEL_PATH)
-        vectorizer = joblib.load(VECTORIZER_PATH)
+        model, vectorizer = load_model(backend)
     except FileNotFoundError:
-        model, vectorizer = train_model()
-        joblib.dump(model, MODEL_PATH)
-        joblib.dump(vectorizer, VECTORIZER_PATH)
-    return model, vectorizer
\ No newline at end of file
+        import pandas as pd
+        df = pd.read_csv(LABELED_DATA_PATH, encoding='utf-8')
+        model, vectorizer = train_model(backend, df)
+        save_model(model, vectorizer, backend, trained_rows=len(df))
+    return model, vectorizer
+
+# Brings the saved model up to date with labeled_data.csv and returns its new manifest entry, or None if there
+# were no new rows. The hashed backend folds in only the rows appended since its last save with partial_fit;
+# anything else (or a label the model has never seen) is retrained from scratch.
+def retrain_model_files(backend="hashed", model_dir=MODEL_DIR, labeled_path=LABELED_DATA_PATH):
+    import pandas as pd
+
+    df = pd.read_csv(labeled_path, encoding='utf-8')
+    entry = read_manifest(model_dir).get(backend) or {}
+    trained_rows = entry.get("trained_rows")
+
+    if trained_rows == len(df):
+        return None
+
+    if backend == "hashed" and trained_rows is not None and trained_rows < len(df):
+        new_rows = df.iloc[trained_rows:]
+        try:
+            model, vectorizer = load_model(backend, model_dir, mmap=False)
+        except FileNotFoundError:
+            model = None
+
+        if model is not None and set(new_rows['price_movement']) <= set(model.classes_):
+            model.densify()
+            model.partial_fit(vectorizer.transform(new_rows['headline']), new_rows['price_movement'])
+            model.sparsify()
+            return save_model(model, vectorizer, backend, model_dir, trained_rows=len(df))
+
+    model, vectorizer = train_model(backend, df)
+    return save_model(model, vectorizer, backend, model_dir, trained_rows=len(df))
+
+# Loads (or trains) the model on a background thread so the window can appear first, and retrains it in a
+# separate process on request; a finished model replaces the current one in a single assignment
+class ModelLoader:
+    def __init__(self, backend=None, model_dir=MODEL_DIR):
+        self.backend = backend or SENTIMENT_BACKEND
+        self.model_dir = model_dir
+        self.pair = (None, None)
+        self.error = None
+        self.load_seconds = None
+        self.retraining = None
+        self.loaded = threading.Event()
+        self.thread = threading.Thread(target=self._load, name="model-loader", daemon=True)
+
+    @property
+    def model(self):
+        return self.pair[0]
+
+    @property
+    def vectorizer(self):
+        return self.pair[1]
+
+    # Returns (model, vectorizer) as one consistent pair
+    def current(self):
+        return self.pair
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            self.pair = train_or_load_model(self.backend)
+        except Exception as e:
+            self.error = e
+            metrics.error("model_load", e)
+            print(f"❌ Error loading sentiment model: {e}")
+        self.load_seconds = time.perf_counter() - start
+        metrics.observe("model_load", self.load_seconds)
+        self.loaded.set()
+
+    # Blocks until loading finished (or the timeout passed); returns whether a model is available
+    def wait(self, timeout=None):
+        self.loaded.wait(timeout)
+        return self.model is not None
+
+    # Starts retrain_model_files in a child process unless a retrain is already running; returns its future
+    def retrain(self):
+        if self.retraining is not None and not self.retraining.done():
+            return self.retraining
+
+        executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        self.retraining = executor.submit(retrain_model_files, self.backend, self.model_dir)
+        self.retraining.add_done_callback(self._finish_retrain)
+        executor.shutdown(wait=False)
+        return self.retraining
+
+    def _finish_retrain(self, future):
+        try:
+            entry = future.result()
+            if entry is None:
+                print("ℹ️ No new labeled headlines to train on")
+                return
+            self.pair = load_model(self.backend, self.model_dir)
+            print(f"✅ Sentiment model updated to version {entry['version']}")
+        except Exception as e:
+            metrics.error("retrain", e)
+            print(f"❌ Error retraining sentiment model: {e}")
@@ -0,0 +1,182 @@
+import os
+import csv
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PRIME_LOG_PATH = os.path.join(BASE_DIR, "data", "prime_log.csv")
+PRIME_DB_PATH = os.path.join(BASE_DIR, "data", "prime_log.db")
+
+# "csv" appends to prime_log.csv; "sqlite" keeps an indexed table in prime_log.db for fast history queries
+PRIME_LOG_BACKEND = "csv"
+
+FIELDS = ["timestamp", "ticker", "price", "target", "stop_loss", "sentiment"]
+
+# Append-only log of Prime signals, at most one per ticker per day. The (ticker, date) index is built once from
+# the stored log; new entries are buffered and written in batches.
+class PrimeLog(ABC):
+    def __init__(self, batch_size=50, flush_interval=30.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+        self.keys = set(self._load_keys())
+
+    # Buffers a Prime setup unless the ticker was already logged today; returns whether it was added
+    def record(self, ticker_data, now=None):
+        now = now or datetime.now()
+        entry = {
+            "timestamp": now.isoformat(),
+            "ticker": ticker_data.get("Ticker"),
+            "price": ticker_data.get("Price"),
+            "target": ticker_data.get("Target"),
+            "stop_loss": ticker_data.get("StopLoss"),
+            "sentiment": ticker_data.get("Sentiment", "")
+        }
+        key = (entry["ticker"], now.date().isoformat())
+
+        with self.lock:
+            if key in self.keys:
+                return False  # Already logged today
+            self.keys.add(key)
+            self.buffer.append(entry)
+
+        self.flush_if_due()
+        return True
+
+    # Flushes once the batch is full or the buffer has waited flush_interval seconds; called on every refresh so
+    # entries reach disk even when no new Prime setups come in
+    def flush_if_due(self):
+        with self.lock:
+            due = self.buffer and (len(self.buffer) >= self.batch_size
+                                   or time.monotonic() - self.last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    # Writes every buffered entry in one batch
+    def flush(self):
+        with self.lock:
+            rows, self.buffer = self.buffer, []
+            self.last_flush = time.monotonic()
+            if rows:
+                self._write(rows)
+
+    # Flushes pending entries; call on shutdown
+    def close(self):
+        self.flush()
+
+    # Returns the (ticker, YYYY-MM-DD) pairs already stored
+    @abstractmethod
+    def _load_keys(self):
+        pass
+
+    # Stores a batch of entries
+    @abstractmethod
+    def _write(self, rows):
+        pass
+
+    # Returns logged entries, oldest first, optionally for one ticker and/or from a date (YYYY-MM-DD) on
+    @abstractmethod
+    def history(self, ticker=None, since=None):
+        pass
+
+# Prime log stored as data/prime_log.csv
+class CsvPrimeLog(PrimeLog):
+    def __init__(self, path=PRIME_LOG_PATH, **kwargs):
+        self.path = path
+        super().__init__(**kwargs)
+
+    # Returns the file's header row: None when the file is missing or blank
+    def _header(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", newline="", encoding="utf-8") as f:
+            return next((row for row in csv.reader(f) if row), None)
+
+    # Refuses a log written with other columns, rather than losing its entries or its dedupe index
+    def _check_header(self):
+        header = self._header()
+        if header is not None and header != FIELDS:
+            raise ValueError(f"{self.path} has columns {header}, expected {FIELDS}; move it aside to start a new log")
+        return header is not None
+
+    def _read_rows(self):
+        if not self._check_header():
+            return []
+        with open(self.path, "r", newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(line for line in f if line.strip()))
+
+    def _load_keys(self):
+        return {(row["ticker"], row["timestamp"][:10]) for row in self._read_rows()}
+
+    def _write(self, rows):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Only a missing or blank file gets a fresh header; a log with the expected header is appended to
+        mode = "a" if self._check_header() else "w"
+        with open(self.path, mode, newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            if mode == "w":
+                writer.writeheader()
+            writer.writerows(rows)
+
+    def history(self, ticker=None, since=None):
+        self.flush()
+        return [
+            row for row in self._read_rows()
+            if (ticker is None or row["ticker"] == ticker) and (since is None or row["timestamp"][:10] >= since)
+        ]
+
+# Prime log stored in an embedded SQLite table indexed by ticker and date
+class SqlitePrimeLog(PrimeLog):
+    def __init__(self, path=PRIME_DB_PATH, **kwargs):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS prime_log ("
+            "timestamp TEXT, day TEXT, ticker TEXT, price REAL, target REAL, stop_loss REAL, sentiment TEXT, "
+            "UNIQUE (ticker, day))"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS prime_log_day ON prime_log (day)")
+        self.db.commit()
+        super().__init__(**kwargs)
+
+    def _load_keys(self):
+        return set(self.db.execute("SELECT ticker, day FROM prime_log"))
+
+    def _write(self, rows):
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO prime_log VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(r["timestamp"], r["timestamp"][:10], r["ticker"], r["price"], r["target"], r["stop_loss"], r["sentiment"])
+                 for r in rows]
+            )
+
+    def history(self, ticker=None, since=None):
+        self.flush()
+        query = "SELECT timestamp, ticker, price, target, stop_loss, sentiment FROM prime_log WHERE 1 = 1"
+        params = []
+        if ticker is not None:
+            query += " AND ticker = ?"
+            params.append(ticker)
+        if since is not None:
+            query += " AND day >= ?"
+            params.append(since)
+        with self.lock:
+            cursor = self.db.execute(query + " ORDER BY timestamp", params)
+            return [dict(zip(FIELDS, row)) for row in cursor]
+
+    def close(self):
+        super().close()
+        self.db.close()
+
+# Opens the Prime log for the configured backend
+def open_prime_log(backend=None, **kwargs):
+    if (backend or PRIME_LOG_BACKEND) == "sqlite":
+        return SqlitePrimeLog(**kwargs)
+    return CsvPrimeLog(**kwargs)
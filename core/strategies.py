@@ -0,0 +1,135 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STRATEGIES_PATH = os.path.join(BASE_DIR, "strategies.json")
+
+# Strategy every screen uses unless another one is named
+DEFAULT_STRATEGY = "default"
+
+# The original short squeeze screen; used when strategies.json is missing
+DEFAULT_STRATEGIES = {
+    DEFAULT_STRATEGY: {
+        "rules": [
+            {"column": "Price", "min": 2, "max": 20},
+            {"column": "Change%", "min": 10},
+            {"column": "Rel Volume", "min": 5},
+            {"column": "Short Float", "min": 5},
+        ],
+        "prime": 4,
+        "subprime": 3,
+    }
+}
+
+# One named screen: rules are (column, min, max, weight) with None for an open bound. A row scores the weight of
+# every rule it meets; a score of at least `prime` is a Prime setup, at least `subprime` a Subprime one.
+# Thresholds must satisfy 1 <= subprime <= prime <= total weight; subprime == prime leaves no Subprime band.
+class Strategy:
+    def __init__(self, name, rules, prime=None, subprime=None):
+        self.name = name
+        self.rules = rules
+        total = sum(weight for *_, weight in rules)
+        self.prime = total if prime is None else prime
+        self.subprime = max(1, self.prime - 1) if subprime is None else subprime
+        if not 1 <= self.subprime <= self.prime <= total:
+            raise ValueError(f"Strategy {name!r}: need 1 <= subprime ({self.subprime}) <= prime ({self.prime}) "
+                             f"<= total weight ({total})")
+
+    # Builds a strategy from its config entry, rejecting rules it cannot evaluate
+    @classmethod
+    def from_config(cls, name, config):
+        rules = []
+        for rule in config.get("rules", []):
+            if "column" not in rule or ("min" not in rule and "max" not in rule):
+                raise ValueError(f"Strategy {name!r}: each rule needs a column and a min and/or max, got {rule}")
+            low, high = rule.get("min"), rule.get("max")
+            rules.append((
+                rule["column"],
+                None if low is None else float(low),
+                None if high is None else float(high),
+                int(rule.get("weight", 1)),
+            ))
+        if not rules:
+            raise ValueError(f"Strategy {name!r} has no rules")
+        return cls(name, rules, config.get("prime"), config.get("subprime"))
+
+# Reads named strategies from a JSON file ({name: {"rules": [...], "prime": n, "subprime": n}});
+# the built-in default screen is used when the file does not exist
+def load_strategies(path=STRATEGIES_PATH):
+    config = DEFAULT_STRATEGIES
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    return {name: Strategy.from_config(name, entry) for name, entry in config.items()}
+
+# Returns a column as a float numpy array, without copying columns that already are one
+def _values(snapshot, column):
+    series = snapshot[column]
+    if series.dtype.kind == "f":
+        return series.to_numpy()
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+# Several strategies compiled together: every distinct rule is evaluated once per snapshot, and all scores come
+# from one (strategies x rules) weight matrix product, so adding a strategy costs no extra pass over the rows
+class StrategySet:
+    def __init__(self, strategies):
+        self.strategies = dict(strategies)
+        self.names = list(self.strategies)
+        self.conditions = list(dict.fromkeys(rule[:3] for s in self.strategies.values() for rule in s.rules))
+        position = {condition: i for i, condition in enumerate(self.conditions)}
+
+        self.weights = np.zeros((len(self.names), len(self.conditions)), dtype="int64")
+        for row, strategy in enumerate(self.strategies.values()):
+            for column, low, high, weight in strategy.rules:
+                self.weights[row, position[(column, low, high)]] += weight
+
+    def __getitem__(self, name):
+        return self.strategies[name]
+
+    def __contains__(self, name):
+        return name in self.strategies
+
+    def __len__(self):
+        return len(self.names)
+
+    # Evaluates every distinct rule once: (rules x rows) booleans, plus which rule columns the snapshot has
+    def _evaluate(self, snapshot):
+        met = np.zeros((len(self.conditions), len(snapshot)), dtype=bool)
+        present = np.zeros(len(self.conditions), dtype=bool)
+        for i, (column, low, high) in enumerate(self.conditions):
+            if column not in snapshot.columns:
+                continue  # A rule on a column the export lacks is never met
+            values = _values(snapshot, column)
+            hit = np.ones(len(snapshot), dtype=bool)
+            if low is not None:
+                hit &= values >= low
+            if high is not None:
+                hit &= values <= high
+            met[i] = hit
+            present[i] = True
+        return met, present
+
+    # Returns one integer score column per strategy
+    def scores(self, snapshot):
+        met, _ = self._evaluate(snapshot)
+        return pd.DataFrame((self.weights @ met).T, index=snapshot.index, columns=self.names)
+
+    # Returns one boolean column per strategy: rows meeting all of its rules. Rules on columns the export does
+    # not include are skipped, as a filter on a missing column cannot be applied.
+    def masks(self, snapshot):
+        met, present = self._evaluate(snapshot)
+        required = (self.weights > 0) & present
+        failed = required.astype("int64") @ ~met
+        return pd.DataFrame((failed == 0).T, index=snapshot.index, columns=self.names)
+
+_compiled = {}
+
+# Returns the compiled strategy set for a config file, reloading it whenever the file changes
+def compiled_strategies(path=STRATEGIES_PATH):
+    stamp = os.path.getmtime(path) if os.path.exists(path) else None
+    cached = _compiled.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _compiled[path] = (stamp, StrategySet(load_strategies(path)))
+    return cached[1]
@@ -0,0 +1,60 @@
+import sys
+import signal
+import argparse
+from contextlib import redirect_stdout
+from controller.controller import Controller
+from controller.service import ScreenerService
+from core.strategies import compiled_strategies
+
+# Runs the screener without a window, printing each refresh as a JSON line and optionally serving the latest one.
+# Usage: python headless.py [--strategy NAME ...] [--interval SECONDS] [--once] [--http PORT] [--host HOST]
+#                           [--output FILE] [--no-news]
+def main():
+    parser = argparse.ArgumentParser(description="Headless stock screener")
+    parser.add_argument("--strategy", action="append", metavar="NAME",
+                        help="strategies.json screen to run (repeat to rank one snapshot under several)")
+    parser.add_argument("--interval", type=float, default=15.0, help="seconds between refreshes")
+    parser.add_argument("--once", action="store_true", help="run a single refresh and exit")
+    parser.add_argument("--http", type=int, metavar="PORT", help="serve GET /latest and /stats on this port")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--output", help="append JSON lines to this file instead of stdout")
+    parser.add_argument("--no-news", action="store_true", help="skip the positive news classification")
+    args = parser.parse_args()
+
+    strategies = args.strategy or ["default"]
+    try:
+        unknown = [name for name in strategies if name not in compiled_strategies()]
+    except ValueError as e:
+        parser.error(f"invalid strategies.json: {e}")
+    if unknown:
+        parser.error(f"unknown strategy: {', '.join(unknown)} (see strategies.json)")
+
+    output = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    # The pipeline modules print status messages; keep them on stderr so stdout carries only JSON lines
+    with redirect_stdout(sys.stderr):
+        run(args, strategies, output)
+    if args.output:
+        output.close()
+
+# Builds the controller and service and refreshes until --once is done, SIGTERM or Ctrl+C
+def run(args, strategies, output):
+    controller = Controller(strategy=strategies[0])
+    service = ScreenerService(controller, interval=args.interval, output=output, news=not args.no_news,
+                              strategies=strategies if len(strategies) > 1 else None)
+
+    if args.http is not None:
+        host, port = service.serve(args.host, args.http)
+        print(f"🌐 Serving http://{host}:{port}/latest", file=sys.stderr)
+
+    signal.signal(signal.SIGTERM, lambda *_: service.stopped.set())
+    controller.model_loader.wait()
+    try:
+        service.run(once=args.once)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        controller.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import sys
+import time
+from controller.controller import Controller
+from core.momentum import MomentumTracker
+from core.recorder import ReplayFeed, replay
+from core.signal_log import SqlitePrimeLog
+
+# Replays recorded screener/news snapshots through the full pipeline without a Finviz key.
+# Usage: python replay.py [start YYYY-MM-DD] [end YYYY-MM-DD] [speed]
+def main():
+    start = sys.argv[1] if len(sys.argv) > 1 else None
+    end = sys.argv[2] if len(sys.argv) > 2 else None
+    speed = float(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    feed = ReplayFeed(start=start, end=end)
+    if not len(feed):
+        print("⚠️ No recorded snapshots found. Set RECORD_SNAPSHOTS = True in core/recorder.py and run the app first.")
+        return
+
+    # Momentum is measured on the recorded clock, not the (much faster) replay clock
+    momentum = MomentumTracker(clock=lambda: feed.now.timestamp())
+    controller = Controller(load_snapshot=feed.screener, fetch_news=feed.news, prime_log=SqlitePrimeLog(":memory:"),
+                            momentum=momentum)
+    controller.model_loader.wait()
+
+    began = time.perf_counter()
+    for at, prime, subprime, positive in replay(feed, controller, speed):
+        print(f"{at:%Y-%m-%d %H:%M:%S}  prime={len(prime):<3} subprime={len(subprime):<3} positive news={len(positive)}")
+
+    print(f"✅ Replayed {len(feed)} refreshes in {time.perf_counter() - began:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+from core.backtest import backtest, summarize
+
+TICKER_COUNTS = [50, 200, 500]
+SIGNALS_PER_TICKER = 20
+
+# Builds a year of 30-minute regular-session bars (13 per day) as a random walk per ticker
+def make_bars(tickers, days=252, seed=42):
+    rng = np.random.default_rng(seed)
+    sessions = pd.bdate_range("2025-01-02", periods=days)
+    times = (sessions.values[:, None] + pd.Timedelta("9h30min").to_timedelta64()
+             + np.arange(13) * pd.Timedelta("30min").to_timedelta64()).ravel()
+
+    steps = rng.normal(0, 0.01, (tickers, len(times)))
+    close = 10 * np.exp(np.cumsum(steps, axis=1))
+    spread = np.abs(rng.normal(0, 0.01, (tickers, len(times))))
+    return pd.DataFrame({
+        "ticker": np.repeat([f"T{i:04d}" for i in range(tickers)], len(times)),
+        "timestamp": np.tile(times, tickers),
+        "high": (close * (1 + spread)).ravel(),
+        "low": (close * (1 - spread)).ravel(),
+        "close": close.ravel(),
+    })
+
+# Picks random bars as entry points with Target/StopLoss levels in the ranges the screener produces
+def make_signals(bars, count, seed=7):
+    rng = np.random.default_rng(seed)
+    picks = bars.iloc[rng.choice(len(bars), count, replace=False)]
+    return pd.DataFrame({
+        "timestamp": picks["timestamp"].to_numpy(),
+        "ticker": picks["ticker"].to_numpy(),
+        "price": picks["close"].to_numpy(),
+        "target": rng.uniform(3, 15, count),
+        "stop_loss": -rng.uniform(1, 6, count),
+    })
+
+def main():
+    print(f"{'tickers':>8} {'bars':>10} {'signals':>8} {'backtest (s)':>13} {'target rate':>12} {'avg return %':>13}")
+    for tickers in TICKER_COUNTS:
+        bars = make_bars(tickers)
+        signals = make_signals(bars, tickers * SIGNALS_PER_TICKER)
+
+        start = time.perf_counter()
+        summary = summarize(backtest(signals, bars))
+        elapsed = time.perf_counter() - start
+
+        print(f"{tickers:>8} {len(bars):>10} {len(signals):>8} {elapsed:>13.3f} "
+              f"{summary['target_hit_rate']:>12.3f} {summary['avg_return_pct']:>13.3f}")
+
+if __name__ == "__main__":
+    main()
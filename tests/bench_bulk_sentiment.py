@@ -0,0 +1,48 @@
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+from core import sentiment
+from core.bulk_sentiment import bulk_score
+
+ROWS = 50000
+CHUNK_SIZE = 5000
+
+# Builds a backfill-sized batch from the labeled headlines, with ticker prefixes so most headlines are distinct
+def make_headlines(rows, seed=7):
+    rng = np.random.default_rng(seed)
+    headlines = pd.read_csv(sentiment.LABELED_DATA_PATH)["headline"].to_numpy()
+    picks = rng.integers(0, len(headlines), rows)
+    return pd.DataFrame({"headline": [f"T{i % 2000}: {headlines[n]}" for i, n in enumerate(picks)]})
+
+def chunks(frame):
+    for start in range(0, len(frame), CHUNK_SIZE):
+        yield frame.iloc[start:start + CHUNK_SIZE]
+
+# Usage: python tests/bench_bulk_sentiment.py [backend]
+def main():
+    backend = sys.argv[1] if len(sys.argv) > 1 else "hashed"
+    frame = make_headlines(ROWS)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        sentiment.retrain_model_files(backend, model_dir)
+        model, vectorizer = sentiment.load_model(backend, model_dir)
+
+        sample = frame["headline"].head(CHUNK_SIZE).tolist()
+        start = time.perf_counter()
+        sentiment.classify_headlines(sample, model, vectorizer)
+        loop = (time.perf_counter() - start) * len(frame) / len(sample)
+        print(f"{backend}: {ROWS} headlines, {os.cpu_count()} CPUs")
+        print(f"{'classify_headlines loop (extrapolated)':<40} {loop:>8.2f}s")
+
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            output = os.path.join(model_dir, f"scored_{workers}.parquet")
+            stats = bulk_score(chunks(frame), output, backend=backend, model_dir=model_dir, workers=workers)
+            print(f"{f'bulk_score workers={workers}':<40} {stats['seconds']:>8.2f}s  ({ROWS / stats['seconds']:,.0f}/s)")
+
+if __name__ == "__main__":
+    main()
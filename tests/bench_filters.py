@@ -0,0 +1,142 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+from core.filters import normalize_snapshot, rank_and_group_stocks, rank_strategies
+from core.strategies import Strategy, StrategySet
+from fake_finviz import make_screener_frame
+
+ROW_COUNTS = [10000, 25000, 50000, 100000]
+
+# Five variations on the default screen, for timing several strategies against one snapshot
+STRATEGY_COUNT = 5
+def make_strategies(count=STRATEGY_COUNT):
+    return StrategySet({
+        f"s{i}": Strategy.from_config(f"s{i}", {"rules": [
+            {"column": "Price", "min": 2, "max": 20 - i},
+            {"column": "Change%", "min": 10 + 2 * i},
+            {"column": "Rel Volume", "min": 5},
+            {"column": "Short Float", "min": 5 + i},
+        ]})
+        for i in range(count)
+    })
+
+# Legacy per-cell parsers, kept as the baseline the column parsers in core.filters are timed against.
+# Converts a percentage string like '12.3%' to float 12.3
+def clean_percent(value):
+    try:
+        return float(value.strip('%'))
+    except:
+        return None
+
+# Converts a float string like '5.1M' to 5100000
+def clean_float(value):
+    try:
+        return int(value) * 1000000
+    except:
+        return None
+
+# Calculates percentage change from previous close
+def change_from_close(price, prev_close):
+    if pd.isna(price) or pd.isna(prev_close) or price == 0:
+        return '0'
+    change_pct = ((price - prev_close) / prev_close) * 100
+    return change_pct
+
+# Row-by-row scorer kept as the reference the vectorized engine must match
+def legacy_group_stocks(df):
+    df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
+    df["Previous Close"] = pd.to_numeric(df["Prev Close"], errors="coerce")
+    df["Change%"] = df.apply(lambda row: change_from_close(row["Price"], row["Previous Close"]), axis=1)
+    df["Rel Volume"] = pd.to_numeric(df["Relative Volume"], errors="coerce")
+    df["Float"] = df["Shares Float"].apply(clean_float)
+    df["Short Float"] = df["Short Float"].apply(clean_percent)
+    df = df.dropna(subset=["Float"])
+
+    prime, subprime = [], []
+    for _, row in df.iterrows():
+        score = 0
+        if 2 <= row["Price"] <= 20: score += 1
+        if row["Change%"] >= 10: score += 1
+        if row["Rel Volume"] >= 5: score += 1
+        if row["Short Float"] >= 5: score += 1
+
+        vol_w = float(str(row.get("Volatility (Week)", 0)).replace('%', ''))
+        rsi = float(row.get("Relative Strength Index (14)", 50))
+
+        stock_data = {
+            "Ticker": row.get("Ticker", ""),
+            "Price": row.get("Price", ""),
+            "Float": row.get("Shares Float", ""),
+            "RelVolume": row.get("Relative Volume", ""),
+            "ChangePercent": row.get("Change", ""),
+            "ShortFloat": row.get("Short Float", ""),
+            "Target": round(0.7 * vol_w + 0.03 * (70 - rsi), 2),
+            "StopLoss": round((0.3 * vol_w - 0.02 * (rsi - 50)) * -1, 2),
+            "Headline": None
+        }
+
+        if score == 4:
+            prime.append(stock_data)
+        elif score == 3:
+            subprime.append(stock_data)
+
+    return prime, subprime
+
+# Parses the export and ranks it the way a refresh does
+def snapshot_group_stocks(df):
+    return rank_and_group_stocks(normalize_snapshot(df))
+
+# Returns the best wall-clock time of fn over a few runs, each on a fresh copy of the frame
+def best_time(fn, df, repeat):
+    timings = []
+    for _ in range(repeat):
+        frame = df.copy()
+        start = time.perf_counter()
+        result = fn(frame)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+# Counts tickers whose record differs between the two scorers; should be 0.
+# Target and StopLoss may differ by a cent: half cents now round away from zero where round() went either way.
+LEVEL_KEYS = {"Target", "StopLoss"}
+def count_mismatches(expected, actual):
+    old = {row["Ticker"]: row for row in expected}
+    new = {row["Ticker"]: row for row in actual}
+    mismatches = len(old.keys() ^ new.keys())
+    for ticker in old.keys() & new.keys():
+        for key, value in old[ticker].items():
+            if isinstance(value, str) or value is None:
+                same = value == new[ticker][key]
+            else:
+                same = np.isclose(value, new[ticker][key], atol=0.0101 if key in LEVEL_KEYS else 1e-8, equal_nan=True)
+            if not same:
+                mismatches += 1
+                break
+    return mismatches
+
+def main():
+    print(f"{'rows':>8} {'legacy (s)':>12} {'vectorized (s)':>15} {'speedup':>9} {'mismatches':>11}")
+    for rows in ROW_COUNTS:
+        df = make_screener_frame(rows)
+        legacy_time, legacy = best_time(legacy_group_stocks, df, repeat=1)
+        fast_time, fast = best_time(snapshot_group_stocks, df, repeat=3)
+        mismatches = count_mismatches(legacy[0], fast[0]) + count_mismatches(legacy[1], fast[1])
+
+        print(f"{rows:>8} {legacy_time:>12.3f} {fast_time:>15.4f} {legacy_time / fast_time:>8.1f}x {mismatches:>11}")
+
+    strategies = make_strategies()
+    print(f"\n{STRATEGY_COUNT} strategies on one snapshot")
+    print(f"{'rows':>8} {'one at a time (s)':>18} {'one pass (s)':>13} {'speedup':>9}")
+    for rows in ROW_COUNTS:
+        snapshot = normalize_snapshot(make_screener_frame(rows))
+        separate_time, _ = best_time(
+            lambda df: [rank_and_group_stocks(df, name, strategies) for name in strategies.names], snapshot, repeat=3)
+        single_time, _ = best_time(lambda df: rank_strategies(df, strategies=strategies), snapshot, repeat=3)
+        print(f"{rows:>8} {separate_time:>18.4f} {single_time:>13.4f} {separate_time / single_time:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import sys
+import os
+import io
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+import core.finviz_api as finviz_api
+from core import sentiment
+from core.metrics import metrics
+from core.signal_log import SqlitePrimeLog
+from controller.controller import Controller
+from fake_finviz import FakeFinviz, make_screener_frame
+
+ROW_COUNTS = [500, 2000, 10000, 50000]
+REPEAT = 3
+STAGES = ["fetch", "momentum", "rank", "classify_tickers", "news_poll", "classify_news"]
+
+# Grows a recorded Finviz export to the given row count by repeating it under new ticker names
+def scale_recorded(path, rows):
+    recorded = pd.read_csv(path)
+    copies = -(-rows // len(recorded))
+    frame = pd.concat([recorded] * copies, ignore_index=True).head(rows)
+    frame["Ticker"] = [f"{ticker}{i // len(recorded)}" for i, ticker in enumerate(frame["Ticker"])]
+    return frame.to_csv(index=False)
+
+# Builds a news export with one item per five tickers, using real headlines from labeled_data.csv
+def make_news_csv(tickers, seed=7):
+    rng = np.random.default_rng(seed)
+    headlines = pd.read_csv(sentiment.LABELED_DATA_PATH)["headline"].to_numpy()
+    count = max(20, len(tickers) // 5)
+    picks = rng.choice(len(tickers), count)
+    news = pd.DataFrame({
+        "Title": [f"{tickers[i]}: {headlines[n % len(headlines)]}" for n, i in enumerate(picks)],
+        "Source": "Wire",
+        "Date": pd.date_range("2026-10-16 09:30", periods=count, freq="s").strftime("%Y-%m-%d %H:%M:%S")[::-1],
+        "Url": [f"https://example.com/{n}" for n in range(count)],
+        "Category": "news",
+        "Ticker": [tickers[i] for i in picks],
+    })
+    return news.to_csv(index=False)
+
+# Runs the full refresh pipeline against the fake server: a cold controller each round, nothing cached
+def run_pipeline():
+    timings = {"screener": [], "news": []}
+    for _ in range(REPEAT):
+        finviz_api._cache = finviz_api.ResponseCache({}, finviz_api.FinvizClient())
+        sentiment._prediction_cache.clear()
+        controller = Controller(prime_log=SqlitePrimeLog(":memory:"))
+        controller.model_loader.wait()
+
+        start = time.perf_counter()
+        controller.get_screener_results()
+        timings["screener"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        controller.get_positive_news()
+        timings["news"].append(time.perf_counter() - start)
+        controller.close()
+    return {name: min(values) for name, values in timings.items()}
+
+# Usage: python tests/bench_pipeline.py [recorded_screener.csv]
+def main():
+    recorded = sys.argv[1] if len(sys.argv) > 1 else None
+    stage_header = "".join(f"{stage + ' p50':>{len(stage) + 6}}" for stage in STAGES)
+    print(f"{'rows':>7} {'news':>6} {'screener (s)':>13} {'news (s)':>9}{stage_header}   (stage times in ms)")
+
+    for rows in ROW_COUNTS:
+        screener_csv = scale_recorded(recorded, rows) if recorded else make_screener_frame(rows).to_csv(index=False)
+        news_csv = make_news_csv(pd.read_csv(io.StringIO(screener_csv))["Ticker"].tolist())
+
+        metrics.reset()
+        with FakeFinviz(screener_csv, news_csv) as server:
+            finviz_api.FINVIZ_BASE_URL = server.base_url
+            totals = run_pipeline()
+
+        stages = metrics.snapshot()["stages"]
+        news_items = news_csv.count("\n") - 1
+        stage_cells = "".join(f"{stages[stage]['p50_ms'] if stage in stages else float('nan'):>{len(stage) + 6}.1f}"
+                              for stage in STAGES)
+        print(f"{rows:>7} {news_items:>6} {totals['screener']:>13.3f} {totals['news']:>9.3f}{stage_cells}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import sys
+import os
+import json
+import time
+import tempfile
+import subprocess
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from core.sentiment import LABELED_DATA_PATH, MODEL_FILES, train_model, save_model, load_model
+
+# Resident set size of this process in MB (Linux)
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+# Runs in a fresh interpreter so load time and RSS are not polluted by training: prints JSON
+def measure_load(backend, model_dir, headlines):
+    before = rss_mb()
+    start = time.perf_counter()
+    model, vectorizer = load_model(backend, model_dir)
+    load_seconds = time.perf_counter() - start
+    after_load = rss_mb()
+
+    start = time.perf_counter()
+    for headline in headlines:
+        model.predict_proba(vectorizer.transform([headline]))
+    single_ms = (time.perf_counter() - start) / len(headlines) * 1000
+
+    start = time.perf_counter()
+    model.predict_proba(vectorizer.transform(headlines))
+    batch_ms = (time.perf_counter() - start) / len(headlines) * 1000
+
+    print(json.dumps({
+        "load_s": load_seconds,
+        "load_rss_mb": after_load - before,
+        "single_ms": single_ms,
+        "batch_ms": batch_ms,
+    }))
+
+def main():
+    df = pd.read_csv(LABELED_DATA_PATH, encoding="utf-8")
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42, stratify=df["price_movement"])
+    headlines = test_df["headline"].tolist()
+
+    print(f"{'backend':>8} {'accuracy':>9} {'size (KB)':>10} {'load (s)':>9} {'load RSS (MB)':>14} {'1-by-1 (ms)':>12} {'batched (ms)':>13}")
+    with tempfile.TemporaryDirectory() as model_dir:
+        for backend in MODEL_FILES:
+            model, vectorizer = train_model(backend, train_df)
+            accuracy = (model.predict(vectorizer.transform(headlines)) == test_df["price_movement"].to_numpy()).mean()
+            save_model(model, vectorizer, backend, model_dir)
+            size_kb = sum(os.path.getsize(os.path.join(model_dir, name)) for name in MODEL_FILES[backend]) / 1024
+
+            child = subprocess.run(
+                [sys.executable, __file__, "--load", backend, model_dir],
+                input=json.dumps(headlines), capture_output=True, text=True, check=True
+            )
+            stats = json.loads(child.stdout.strip().splitlines()[-1])
+
+            print(f"{backend:>8} {accuracy:>9.3f} {size_kb:>10.0f} {stats['load_s']:>9.3f} {stats['load_rss_mb']:>14.1f} "
+                  f"{stats['single_ms']:>12.3f} {stats['batch_ms']:>13.4f}")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--load":
+        measure_load(sys.argv[2], sys.argv[3], json.loads(sys.stdin.read()))
+    else:
+        main()
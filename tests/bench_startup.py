@@ -0,0 +1,105 @@
+import sys
+import os
+import csv
+import subprocess
+from datetime import datetime
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RUNS = 5
+
+# Modules that must stay out of the startup import path
+HEAVY_MODULES = ["pandas", "numpy", "sklearn", "joblib", "textblob", "matplotlib", "yfinance"]
+
+IMPORT_CODE = "import controller.controller, ui.view"
+
+# Child process for time-to-first-paint: builds the real window against the local fake Finviz server and reports
+# seconds from interpreter start to the first drawn frame and to the first rendered screener results
+PAINT_CODE = r"""
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, "tests")
+from tkinter import Tk, TclError
+import core.finviz_api as finviz_api
+from controller.controller import Controller
+from ui.view import View
+from fake_finviz import FakeFinviz
+
+with FakeFinviz() as server:
+    finviz_api.FINVIZ_BASE_URL = server.base_url
+    try:
+        root = Tk()
+    except TclError:
+        print("nan nan")
+        sys.exit()
+    controller = Controller()
+    view = View(root, controller)
+    root.update()
+    painted = time.perf_counter() - start
+
+    rendered = []
+    show = view.render_screener_panel
+    view.render_screener_panel = lambda *rows: (rendered.append(time.perf_counter() - start), show(*rows))
+    while not rendered and time.perf_counter() - start < 60:
+        root.update()
+        time.sleep(0.005)
+    view.on_close()
+    print(painted, rendered[0] if rendered else float("nan"))
+"""
+
+# Runs `python -X importtime` on the app's startup imports; returns the total in seconds and the slowest modules
+def import_time():
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_CODE],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):  # one leading space marks a top-level import
+            top_level.append((int(cumulative) / 1e6, name.strip()))
+    return sum(t for t, _ in top_level), sorted(top_level, reverse=True)[:5]
+
+# Lists heavy modules that the startup imports pulled in
+def heavy_imports():
+    code = f"import sys; {IMPORT_CODE}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+def first_paint():
+    result = subprocess.run([sys.executable, "-c", PAINT_CODE], cwd=ROOT, capture_output=True, text=True)
+    try:
+        painted, rendered = result.stdout.split()[-2:]
+        return float(painted), float(rendered)
+    except ValueError:
+        print(result.stderr.strip())
+        return float("nan"), float("nan")
+
+# Usage: python tests/bench_startup.py [history.csv]  (appends one row per run to track startup over time)
+def main():
+    imports = [import_time() for _ in range(RUNS)]
+    total, slowest = min(imports, key=lambda r: r[0])
+    heavy = heavy_imports()
+
+    print(f"startup imports ({IMPORT_CODE}): {total:.3f}s best of {RUNS}")
+    for seconds, name in slowest:
+        print(f"    {seconds:>8.3f}s  {name}")
+    print(f"heavy modules imported at startup: {', '.join(heavy) or 'none'}")
+
+    painted, rendered = first_paint()
+    if painted != painted:
+        print("first paint: skipped (no display)")
+    else:
+        print(f"first paint: {painted:.3f}s   first screener results: {rendered:.3f}s")
+
+    if len(sys.argv) > 1:
+        new_file = not os.path.exists(sys.argv[1])
+        with open(sys.argv[1], "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["date", "import_s", "first_paint_s", "first_results_s", "heavy_modules"])
+            writer.writerow([datetime.now().isoformat(timespec="seconds"), round(total, 4),
+                             round(painted, 4), round(rendered, 4), " ".join(heavy)])
+
+if __name__ == "__main__":
+    main()
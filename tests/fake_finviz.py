@@ -0,0 +1,98 @@
+import threading
+import time
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import pandas as pd
+
+SCREENER_CSV = (
+    "Ticker,Price,Prev Close,Change,Relative Volume,Shares Float,Short Float,Volatility (Week),Relative Strength Index (14)\n"
+    "ABCD,5.50,4.80,14.58%,7.20,12.5,18.40%,12.10%,61.2\n"
+    "EFGH,3.10,3.00,3.33%,6.10,8.0,9.20%,8.00%,48.0\n"
+)
+
+NEWS_CSV = (
+    "Title,Source,Date,Url,Category,Ticker\n"
+    "\"ABCD wins FDA approval\",Wire,2026-10-16 09:31:00,https://example.com/abcd,news,ABCD\n"
+    "\"EFGH misses estimates\",Wire,2026-10-16 09:12:00,https://example.com/efgh,news,EFGH\n"
+)
+
+# Builds a synthetic Finviz-style screener export with string-formatted percent columns
+def make_screener_frame(rows, seed=42):
+    rng = np.random.default_rng(seed)
+    prev_close = rng.uniform(1, 30, rows).round(2)
+    price = (prev_close * rng.uniform(0.8, 1.5, rows)).round(2)
+    return pd.DataFrame({
+        "Ticker": [f"T{i:06d}" for i in range(rows)],
+        "Price": price,
+        "Prev Close": prev_close,
+        "Change": [f"{c:.2f}%" for c in (price - prev_close) / prev_close * 100],
+        "Relative Volume": rng.uniform(0, 12, rows).round(2),
+        "Shares Float": rng.uniform(0.5, 40, rows).round(2),
+        "Short Float": [f"{v:.2f}%" for v in rng.uniform(0, 30, rows)],
+        "Volatility (Week)": [f"{v:.2f}%" for v in rng.uniform(1, 25, rows)],
+        "Relative Strength Index (14)": rng.uniform(10, 90, rows).round(2),
+    })
+
+# Local stand-in for the Finviz Elite export endpoints, with ETag support and switches to simulate outages
+class FakeFinviz:
+    def __init__(self, screener_csv=SCREENER_CSV, news_csv=NEWS_CSV):
+        self.bodies = {"/export.ashx": screener_csv, "/news_export.ashx": news_csv}
+        self.requests = {path: 0 for path in self.bodies}
+        self.status = 200
+        self.failures = []
+        self.delay = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path not in fake.bodies:
+                    self.send_error(404)
+                    return
+                fake.requests[path] += 1
+                time.sleep(fake.delay)
+
+                if fake.failures:
+                    self.send_error(fake.failures.pop(0))
+                    return
+                if fake.status != 200:
+                    self.send_error(fake.status)
+                    return
+
+                body = fake.bodies[path].encode("utf-8")
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
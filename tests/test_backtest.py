@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+import pytest
+from core.backtest import backtest, summarize
+
+def bars(ticker, start, rows):
+    times = pd.date_range(start, periods=len(rows), freq="30min")
+    return pd.DataFrame([
+        {"ticker": ticker, "timestamp": t, "high": h, "low": l, "close": c} for t, (h, l, c) in zip(times, rows)
+    ])
+
+def signal(ticker, timestamp, price=10.0, target=10.0, stop_loss=-5.0):
+    return {"timestamp": timestamp, "ticker": ticker, "price": price, "target": target, "stop_loss": stop_loss}
+
+PRICES = pd.concat([
+    bars("UPUP", "2026-10-12 10:00", [(10.5, 9.8, 10.2), (11.2, 10.1, 11.0), (9.0, 8.0, 8.5)]),
+    bars("DOWN", "2026-10-12 10:00", [(10.2, 9.6, 9.7), (9.8, 9.4, 9.5), (12.0, 11.0, 11.5)]),
+    bars("BOTH", "2026-10-12 10:00", [(11.5, 9.0, 10.0)]),
+    bars("FLAT", "2026-10-12 10:00", [(10.3, 9.8, 10.1), (10.4, 9.9, 10.2)]),
+])
+
+def test_first_level_touched_decides_the_exit():
+    results = backtest([
+        signal("UPUP", "2026-10-12T09:45:00"),
+        signal("DOWN", "2026-10-12T09:45:00"),
+        signal("BOTH", "2026-10-12T09:45:00"),
+        signal("FLAT", "2026-10-12T09:45:00"),
+        signal("NONE", "2026-10-12T09:45:00"),
+    ], PRICES)
+
+    assert list(results["outcome"]) == ["target", "stop", "stop", "open", "no_data"]
+    assert list(results["bars_held"]) == [2, 2, 1, 2, 0]
+    assert results["return_pct"].round(6).tolist()[:4] == [10.0, -5.0, -5.0, 2.0]
+    assert results["exit_time"][0] == pd.Timestamp("2026-10-12 10:30")
+
+def test_only_bars_after_the_signal_count():
+    results = backtest([signal("UPUP", "2026-10-12T10:45:00"), signal("UPUP", "2026-10-12T12:00:00")], PRICES)
+
+    assert list(results["outcome"]) == ["stop", "no_data"]
+
+def test_horizon_limits_the_window():
+    results = backtest([signal("DOWN", "2026-10-12T09:45:00", stop_loss=-50.0)], PRICES, max_bars=2)
+
+    assert results["outcome"][0] == "open"
+    assert results["return_pct"][0] == pytest.approx(-5.0)
+
+def test_summary_rates():
+    summary = summarize(backtest([signal("UPUP", "2026-10-12T09:45:00"), signal("DOWN", "2026-10-12T09:45:00"),
+                                  signal("NONE", "2026-10-12T09:45:00")], PRICES))
+
+    assert summary["traded"] == 2
+    assert summary["target_hit_rate"] == 0.5
+    assert summary["avg_return_pct"] == pytest.approx(2.5)
@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+import pytest
+import core.sentiment as sentiment
+from core.bulk_sentiment import bulk_score, csv_chunks, score_frame
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("model")
+    sentiment.retrain_model_files("hashed", path)
+    return str(path)
+
+@pytest.fixture
+def headlines_csv(tmp_path):
+    labeled = pd.read_csv(sentiment.LABELED_DATA_PATH, encoding="utf-8")
+    frame = pd.DataFrame({"headline": labeled["headline"], "url": [f"https://example.com/{i}" for i in range(len(labeled))]})
+    path = tmp_path / "headlines.csv"
+    frame.to_csv(path, index=False)
+    return str(path), frame
+
+def test_chunk_scores_match_classify_headlines(model_dir):
+    model, vectorizer = sentiment.load_model("hashed", model_dir)
+    headlines = ["ABCD beats estimates", "EFGH misses estimates", "ABCD beats estimates"]
+
+    scored = score_frame(pd.DataFrame({"headline": headlines}), model, vectorizer)
+    expected = sentiment.classify_headlines(headlines, model, vectorizer)
+
+    assert list(scored["prediction"]) == list(expected["prediction"])
+    assert list(scored["confidence_score"]) == pytest.approx(list(expected["confidence_score"]))
+    assert list(scored["sentiment_score"]) == pytest.approx(list(expected["sentiment_score"]))
+
+def test_chunks_are_written_in_input_order(model_dir, headlines_csv, tmp_path):
+    path, frame = headlines_csv
+    output = str(tmp_path / "scored.parquet")
+
+    stats = bulk_score(csv_chunks(path, keep=["url"], chunk_size=100), output, backend="hashed", model_dir=model_dir, workers=1)
+    scored = pd.read_parquet(output)
+
+    assert stats["rows"] == len(frame)
+    assert stats["chunks"] == -(-len(frame) // 100)
+    assert list(scored["url"]) == list(frame["url"])
+    assert list(scored.columns) == ["headline", "url", "prediction", "confidence_score", "sentiment_score"]
+
+def test_process_pool_gives_the_same_results(model_dir, headlines_csv, tmp_path):
+    path, _ = headlines_csv
+    inline, pooled = str(tmp_path / "inline.parquet"), str(tmp_path / "pooled.parquet")
+
+    bulk_score(csv_chunks(path, chunk_size=200), inline, backend="hashed", model_dir=model_dir, workers=1)
+    bulk_score(csv_chunks(path, chunk_size=200), pooled, backend="hashed", model_dir=model_dir, workers=2)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(inline), pd.read_parquet(pooled))
+
+def test_failed_run_leaves_no_partial_file(model_dir, tmp_path):
+    output = str(tmp_path / "scored.parquet")
+    def chunks():
+        yield pd.DataFrame({"headline": ["ABCD beats estimates"]})
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        bulk_score(chunks(), output, backend="hashed", model_dir=model_dir, workers=1)
+    assert os.listdir(tmp_path) == []
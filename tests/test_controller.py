@@ -0,0 +1,102 @@
+import sys
+import os
+import threading
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+import pytest
+import controller.controller as controller_module
+from controller.controller import Controller
+from core.filters import normalize_snapshot
+from core.momentum import MomentumTracker
+from core.signal_log import SqlitePrimeLog
+
+SNAPSHOT = pd.DataFrame({
+    "Ticker": ["ABCD", "EFGH"],
+    "Price": [5.5, 3.1],
+    "Prev Close": [4.8, 3.0],
+    "Change": ["14.58%", "3.33%"],
+    "Relative Volume": [7.2, 6.1],
+    "Shares Float": [12.5, 8.0],
+    "Short Float": ["18.4%", "9.2%"],
+})
+
+NEWS = [{"headline": "ABCD wins FDA approval", "timestamp": "2026-10-16 09:31:00", "url": "https://example.com/abcd",
+         "tickers": ["ABCD"]}]
+
+# Model loader stand-in that stays "loading" until finish() is called
+class FakeLoader:
+    def __init__(self):
+        self.loaded = threading.Event()
+        self.pair = (None, None)
+
+    def start(self):
+        return self
+
+    def current(self):
+        return self.pair
+
+    def finish(self):
+        self.pair = ("model", "vectorizer")
+        self.loaded.set()
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setattr(controller_module, "ModelLoader", FakeLoader)
+    monkeypatch.setattr(controller_module, "classify_tickers",
+                        lambda headlines, model, vectorizer: {ticker: "📈 Positive (90%)" for ticker in headlines})
+    feed = list(NEWS)
+    def fetch_news():
+        controller.fetches += 1
+        if controller.news_error:
+            raise controller.news_error
+        return list(feed)
+    controller = Controller(load_snapshot=lambda: normalize_snapshot(SNAPSHOT), fetch_news=fetch_news,
+                            prime_log=SqlitePrimeLog(":memory:"), momentum=MomentumTracker(max_tickers=10))
+    controller.fetches = 0
+    controller.news_error = None
+    controller.feed = feed
+    yield controller
+    controller.close()
+
+def test_primes_seen_while_the_model_loads_are_logged_with_sentiment(controller):
+    controller.get_screener_results()
+    assert controller.prime_log.history() == []
+
+    controller.model_loader.finish()
+    controller.get_screener_results()
+
+    logged = controller.prime_log.history()
+    assert [(row["ticker"], row["sentiment"]) for row in logged] == [("ABCD", "📈 Positive (90%)")]
+
+def test_every_screener_refresh_polls_the_news(controller):
+    controller.get_screener_results()
+    controller.feed.insert(0, {"headline": "ABCD raises guidance", "timestamp": "2026-10-16 09:40:00",
+                               "url": "https://example.com/abcd-2", "tickers": ["ABCD"]})
+    controller.get_screener_results()
+    assert controller.match_headline("ABCD") == "ABCD raises guidance"
+
+    controller.get_positive_news()  # model still loading: the news is queued, not dropped
+    assert controller.fetches == 3
+    assert [item["headline"] for item in controller.pending_news] == ["ABCD raises guidance", "ABCD wins FDA approval"]
+
+def test_news_outages_leave_the_screener_running_and_fail_the_news_refresh(controller):
+    controller.get_screener_results()
+    controller.news_error = ConnectionError("feed down")
+
+    controller.get_screener_results()
+    assert controller.match_headline("ABCD") == "ABCD wins FDA approval"
+    with pytest.raises(ConnectionError):
+        controller.get_positive_news()
+
+def test_chart_failures_come_back_as_messages(controller, tmp_path):
+    from core.prices import PriceCache
+    def source(ticker, period, interval):
+        if ticker == "EMPTY":
+            return pd.DataFrame({"Close": []})
+        raise ConnectionError("yahoo down")
+    controller.prices = PriceCache(source, root=tmp_path)
+
+    assert controller.load_chart("../../x") == (None, "Invalid ticker: '../../X'")
+    assert controller.load_chart("ABCD") == (None, "yahoo down")
+    assert controller.load_chart("EMPTY") == (None, "No data returned")
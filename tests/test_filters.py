@@ -3,7 +3,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from core.finviz_api import fetch_finviz_data
-from core.filters import apply_filters
+from core.filters import apply_filters, normalize_snapshot
 
 def main():
     print("Fetching Finviz data...")
@@ -15,7 +15,7 @@ def main():
         return
 
     print("Applying short squeeze filters...")
-    filtered = apply_filters(df)
+    filtered = apply_filters(normalize_snapshot(df))
 
     if filtered.empty:
         print("⚠️ No stocks matched your short squeeze criteria.")
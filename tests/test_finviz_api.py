@@ -0,0 +1,124 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import io
+import threading
+import pandas as pd
+import pytest
+import core.finviz_api as finviz_api
+from core.filters import normalize_snapshot
+from fake_finviz import FakeFinviz, make_screener_frame
+
+@pytest.fixture
+def fake(monkeypatch):
+    with FakeFinviz() as server:
+        monkeypatch.setattr(finviz_api, "FINVIZ_BASE_URL", server.base_url)
+        monkeypatch.setattr(finviz_api, "_cache", finviz_api.ResponseCache({"screener": 60, "news": 60}, finviz_api.FinvizClient(backoff=0)))
+        yield server
+
+def test_fresh_responses_are_served_from_cache(fake):
+    first = finviz_api.fetch_finviz_data()
+    second = finviz_api.fetch_finviz_data()
+
+    assert list(first["Ticker"]) == list(second["Ticker"]) == ["ABCD", "EFGH"]
+    assert fake.requests["/export.ashx"] == 1
+    assert finviz_api.cache_stats()["hits"] == 1
+    assert finviz_api.cache_stats()["misses"] == 1
+
+def test_expired_entries_revalidate_with_etag(fake):
+    finviz_api._cache.ttl["news"] = 0
+    finviz_api.fetch_all_finviz_api_news()
+    news = finviz_api.fetch_all_finviz_api_news()
+
+    assert [item["tickers"] for item in news] == [["ABCD"], ["EFGH"]]
+    assert fake.requests["/news_export.ashx"] == 2
+    assert finviz_api.cache_stats()["not_modified"] == 1
+
+def test_concurrent_callers_share_one_request(fake):
+    fake.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(finviz_api.fetch_finviz_data())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [len(df) for df in results] == [2, 2, 2, 2]
+    assert fake.requests["/export.ashx"] == 1
+    assert finviz_api.cache_stats()["misses"] == 1
+    assert finviz_api.cache_stats()["hits"] == 3
+
+def test_last_good_response_survives_an_outage(fake):
+    finviz_api._cache.ttl["screener"] = 0
+    finviz_api.fetch_finviz_data()
+    fake.status = 503
+
+    df = finviz_api.fetch_finviz_data()
+
+    assert len(df) == 2
+    assert finviz_api.cache_stats()["stale"] == 1
+
+def test_outage_without_cached_data_raises(fake):
+    fake.status = 500
+    with pytest.raises(Exception):
+        finviz_api.fetch_finviz_data()
+    with pytest.raises(Exception):
+        finviz_api.fetch_all_finviz_api_news()
+
+def test_rate_limits_and_server_errors_are_retried(fake):
+    fake.failures = [429, 503]
+
+    df = finviz_api.fetch_finviz_data()
+
+    assert len(df) == 2
+    assert fake.requests["/export.ashx"] == 3
+    stats = finviz_api.client_stats()
+    assert stats["retries"] == 2
+    assert stats["latency"]["count"] == 3
+
+def test_client_counters_add_up_across_threads(fake):
+    client = finviz_api.FinvizClient(backoff=0)
+    url = fake.base_url + "/news_export.ashx"
+    threads = [threading.Thread(target=lambda: [client.get(url) for _ in range(25)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.stats["requests"] == 200
+    assert client.latency_stats()["count"] == 200
+
+def test_screener_export_is_projected_and_typed(fake):
+    df = finviz_api.fetch_finviz_data()
+
+    assert list(df.columns) == list(finviz_api.SCREENER_COLUMNS)
+    assert df["Price"].dtype == "float64"
+    assert list(df["Short Float"]) == [18.4, 9.2]
+    assert list(df["Change"]) == ["14.58%", "3.33%"]
+
+def test_unused_columns_blanks_and_junk_while_parsing():
+    content = (
+        "Ticker,Price,Prev Close,Relative Volume,Shares Float,Volatility (Week),Sector\n"
+        "NA, 5.5 ,4,abc,,-,Tech\n"
+        "WXYZ,,3,1e1,2.5,3.5%,Energy\n"
+    ).encode()
+
+    df = finviz_api.read_screener_csv(content)
+
+    assert list(df.columns) == ["Ticker", "Price", "Prev Close", "Relative Volume", "Shares Float", "Volatility (Week)"]
+    assert list(df["Ticker"]) == ["NA", "WXYZ"]
+    assert df["Price"].tolist()[0] == 5.5 and pd.isna(df["Price"][1])
+    assert pd.isna(df["Relative Volume"][0]) and df["Relative Volume"][1] == 10.0
+    assert df["Volatility (Week)"].tolist() == [0.0, 3.5]
+
+def test_parsed_export_normalizes_like_pandas_read_csv():
+    frame = make_screener_frame(500)
+    frame.loc[::7, "Short Float"] = ""
+    frame.loc[::11, "Volatility (Week)"] = "-"
+    text = frame.to_csv(index=False)
+
+    expected = normalize_snapshot(pd.read_csv(io.StringIO(text)))
+    parsed = normalize_snapshot(finviz_api.read_screener_csv(text.encode()))
+
+    pd.testing.assert_frame_equal(parsed, expected)
@@ -0,0 +1,39 @@
+import sys
+import os
+import json
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from core.metrics import Metrics, dump_metrics
+
+def test_stage_latencies_land_in_histogram_buckets():
+    metrics = Metrics()
+    for seconds in (0.0005, 0.003, 0.004, 0.150, 30.0):
+        metrics.observe("fetch", seconds)
+
+    stats = metrics.snapshot()["stages"]["fetch"]
+    assert stats["count"] == 5
+    assert stats["histogram"] == {"<=1ms": 1, "<=5ms": 2, "<=200ms": 1, ">10000ms": 1}
+    assert stats["p50_ms"] == pytest.approx(4.0)
+    assert stats["max_ms"] == pytest.approx(30000.0)
+
+def test_timed_block_failures_are_counted_and_reraised():
+    metrics = Metrics()
+    with pytest.raises(ConnectionError):
+        with metrics.time("fetch"):
+            raise ConnectionError("finviz down")
+
+    report = metrics.snapshot()
+    assert report["stages"]["fetch"]["count"] == 1
+    assert report["errors"]["fetch"]["count"] == 1
+    assert report["errors"]["fetch"]["last"] == "finviz down"
+
+def test_counts_keep_last_total_and_max(tmp_path):
+    metrics = Metrics()
+    for rows in (120, 80):
+        metrics.count("snapshot_rows", rows)
+    assert metrics.snapshot()["counts"]["snapshot_rows"] == {"last": 80, "total": 200, "max": 120}
+
+    path = dump_metrics(metrics.snapshot(), str(tmp_path / "metrics.json"))
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["counts"]["snapshot_rows"]["last"] == 80
@@ -0,0 +1,52 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+from core.momentum import MomentumTracker
+
+def snapshot(rows):
+    return pd.DataFrame({
+        "Ticker": [ticker for ticker, _, _ in rows],
+        "Rel Volume": np.array([rel_volume for _, rel_volume, _ in rows], dtype="float32"),
+        "Change%": np.array([change for _, _, change in rows], dtype="float32"),
+    })
+
+def test_deltas_and_rates_between_refreshes():
+    tracker = MomentumTracker(columns=["Rel Volume", "Change%"], length=10, max_tickers=4, window=60)
+
+    first = tracker.update(snapshot([("ABCD", 2.0, 5.0), ("EFGH", 1.0, 3.0)]), at=0)
+    assert first["Rel Volume Rate"].isna().all()
+
+    tracker.update(snapshot([("ABCD", 3.0, 8.0), ("EFGH", 1.0, 3.0)]), at=30)
+    latest = tracker.update(snapshot([("ABCD", 5.0, 14.0), ("IJKL", 4.0, 1.0)]), at=90)
+
+    # Measured against the newest refresh at least 60 s old (t=30)
+    assert latest["Rel Volume Delta"][0] == 2.0
+    assert latest["Rel Volume Rate"][0] == 2.0
+    assert latest["Change% Rate"][0] == 6.0
+    assert np.isnan(latest["Change% Delta"][1])  # IJKL has no earlier refresh
+
+def test_memory_is_fixed_and_stale_tickers_are_evicted():
+    tracker = MomentumTracker(columns=["Rel Volume"], length=5, max_tickers=3)
+    size = tracker.nbytes()
+
+    for minute in range(50):
+        tickers = [("ABCD", minute, 0)] + [(f"T{minute}", 1.0, 0)]
+        tracker.update(snapshot(tickers), at=minute * 60)
+
+    assert tracker.nbytes() == size
+    assert len(tracker.slots) == 3
+    assert "ABCD" in tracker.slots
+    assert tracker.history("ABCD")["Rel Volume"].tolist() == [45, 46, 47, 48, 49]
+    assert tracker.stats["evicted"] == 48
+
+def test_tickers_beyond_capacity_get_no_history():
+    tracker = MomentumTracker(columns=["Rel Volume"], length=3, max_tickers=2)
+    rows = [("ABCD", 1.0, 0), ("EFGH", 1.0, 0), ("IJKL", 1.0, 0)]
+    tracker.update(snapshot(rows), at=0)
+    result = tracker.update(snapshot(rows), at=60)
+
+    assert result["Rel Volume Delta"].notna().tolist() == [True, True, False]
+    assert tracker.stats["untracked"] == 1
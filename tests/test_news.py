@@ -0,0 +1,41 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.news import NewsIndex, NewsIngester
+
+def news(headline, *tickers):
+    return {"headline": headline, "tickers": list(tickers), "url": f"https://example.com/{headline}"}
+
+def test_index_returns_newest_headline_per_ticker():
+    index = NewsIndex([news("abcd-new", "ABCD", "EFGH"), news("abcd-old", "ABCD")])
+
+    assert index.headline("ABCD") == "abcd-new"
+    assert index.headline("EFGH") == "abcd-new"
+    assert index.headline("ZZZZ") == ""
+
+def test_new_batches_take_precedence_and_buckets_stay_bounded():
+    index = NewsIndex([news("first", "ABCD")], per_ticker=2)
+    index.add([news("third", "ABCD"), news("second", "ABCD")])
+
+    assert [item["headline"] for item in index.latest("ABCD")] == ["third", "second"]
+
+def test_ingester_returns_only_unseen_items():
+    feed = [[news("b", "ABCD"), news("a", "ABCD")], [news("c", "EFGH"), news("b", "ABCD"), news("a", "ABCD")]]
+    ingester = NewsIngester(fetch=lambda: feed.pop(0))
+
+    assert [item["headline"] for item in ingester.poll()] == ["b", "a"]
+    assert [item["headline"] for item in ingester.poll()] == ["c"]
+    assert [item["headline"] for item in ingester.newest()] == ["c", "b", "a"]
+    assert ingester.headline("EFGH") == "c"
+
+def test_ingester_evicts_oldest_items_and_their_index_entries():
+    feed = [[news("b", "ABCD"), news("a", "EFGH")], [news("d", "IJKL"), news("c", "IJKL")]]
+    ingester = NewsIngester(fetch=lambda: feed.pop(0), max_items=3)
+    ingester.poll()
+    ingester.poll()
+
+    assert [item["headline"] for item in ingester.newest()] == ["d", "c", "b"]
+    assert ingester.headline("EFGH") == ""
+    assert not ingester.contains("https://example.com/a")
+    assert ingester.stats["evicted"] == 1
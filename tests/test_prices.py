@@ -0,0 +1,97 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+import pytest
+from core.prices import PriceCache
+
+# Local price source that counts downloads and can be held open or made to fail
+class StubSource:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self.fail = False
+
+    def __call__(self, ticker, period, interval):
+        self.calls.append(ticker)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("source down")
+        index = pd.date_range("2026-10-12 09:30", periods=3, freq="30min")
+        return pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index=index)
+
+def test_bars_are_reused_from_memory_and_disk(tmp_path):
+    source = StubSource()
+    cache = PriceCache(source, root=tmp_path)
+
+    assert list(cache.get("abcd")["Close"]) == [1.0, 2.0, 3.0]
+    cache.get("ABCD")
+    assert source.calls == ["ABCD"]
+
+    # A new cache (e.g. after a restart) reads the stored file instead of downloading
+    restarted = PriceCache(source, root=tmp_path)
+    bars = restarted.get("ABCD")
+    assert source.calls == ["ABCD"]
+    assert restarted.stats["disk_hits"] == 1
+    assert bars.index[0] == pd.Timestamp("2026-10-12 09:30")
+
+def test_expired_bars_are_downloaded_again_and_kept_as_fallback(tmp_path):
+    source = StubSource()
+    cache = PriceCache(source, root=tmp_path, ttl=0)
+    cache.get("ABCD")
+    cache.get("ABCD")
+    assert source.calls == ["ABCD", "ABCD"]
+
+    source.fail = True
+    assert list(cache.get("ABCD")["Close"]) == [1.0, 2.0, 3.0]
+    assert cache.stats["stale"] == 1
+
+    with pytest.raises(ConnectionError):
+        cache.get("EFGH")
+
+def test_prefetch_downloads_in_parallel_and_get_joins_running_downloads(tmp_path):
+    source = StubSource(delay=0.2)
+    cache = PriceCache(source, root=tmp_path, max_workers=4)
+
+    start = time.perf_counter()
+    futures = cache.prefetch(["ABCD", "EFGH", "IJKL", "MNOP", "ABCD"])
+    assert cache.prefetch(["ABCD"]) == []
+    cache.get("ABCD")
+    for future in futures:
+        future.result()
+
+    assert sorted(source.calls) == ["ABCD", "EFGH", "IJKL", "MNOP"]
+    assert time.perf_counter() - start < 0.6
+
+def test_old_files_are_evicted_when_the_cache_opens(tmp_path):
+    PriceCache(StubSource(), root=tmp_path).get("ABCD")
+    past = time.time() - 3600
+    for name in os.listdir(tmp_path):
+        os.utime(tmp_path / name, (past, past))
+
+    source = StubSource()
+    PriceCache(source, root=tmp_path, keep=60).get("ABCD")
+    assert source.calls == ["ABCD"]
+
+def test_tickers_that_are_not_plain_symbols_are_rejected(tmp_path):
+    source = StubSource()
+    cache = PriceCache(source, root=tmp_path / "prices")
+
+    with pytest.raises(ValueError):
+        cache.get("../../x")
+    for future in cache.prefetch(["../x", "BRK.B", None]):
+        future.result()
+    assert source.calls == ["BRK.B"]
+    assert os.listdir(tmp_path) == ["prices"]
+
+def test_prefetch_reads_fresh_files_instead_of_downloading(tmp_path):
+    source = StubSource()
+    PriceCache(source, root=tmp_path).get("ABCD")
+
+    restarted = PriceCache(source, root=tmp_path)
+    for future in restarted.prefetch(["ABCD"]):
+        assert list(future.result()["Close"]) == [1.0, 2.0, 3.0]
+    assert source.calls == ["ABCD"]
+    assert restarted.stats["disk_hits"] == 1
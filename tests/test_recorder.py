@@ -0,0 +1,47 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import io
+from datetime import datetime
+import pandas as pd
+from core.filters import normalize_snapshot, rank_and_group_stocks
+from core.recorder import SnapshotRecorder, ReplayFeed, list_snapshots
+from fake_finviz import SCREENER_CSV
+
+NINE_THIRTY = datetime(2026, 10, 16, 9, 30)
+NINE_FORTY_FIVE = datetime(2026, 10, 16, 9, 45)
+
+def news(headline, ticker):
+    return {"headline": headline, "timestamp": "2026-10-16 09:31:00", "url": f"https://example.com/{headline}", "tickers": [ticker]}
+
+def test_snapshots_round_trip_with_their_dtypes(tmp_path):
+    snapshot = normalize_snapshot(pd.read_csv(io.StringIO(SCREENER_CSV)))
+    recorder = SnapshotRecorder(tmp_path)
+    recorder.record_screener(snapshot, NINE_THIRTY)
+    assert recorder.record_screener(snapshot, NINE_FORTY_FIVE) is None  # unchanged data is not stored twice
+
+    feed = ReplayFeed(tmp_path)
+    feed.advance()
+    replayed = feed.screener()
+
+    assert replayed.dtypes.equals(snapshot.dtypes)
+    assert rank_and_group_stocks(replayed) == rank_and_group_stocks(snapshot)
+    assert [at for at, _ in list_snapshots("screener", tmp_path)] == [NINE_THIRTY]
+
+def test_feed_hands_out_news_as_the_replay_clock_passes_it(tmp_path):
+    snapshot = normalize_snapshot(pd.read_csv(io.StringIO(SCREENER_CSV)))
+    recorder = SnapshotRecorder(tmp_path)
+    recorder.record_news([news("early", "ABCD")], NINE_THIRTY.replace(minute=20))
+    recorder.record_screener(snapshot, NINE_THIRTY)
+    recorder.record_news([news("late", "EFGH")], NINE_THIRTY.replace(minute=40))
+    recorder.record_screener(snapshot.iloc[:1], NINE_FORTY_FIVE)
+
+    feed = ReplayFeed(tmp_path)
+    assert feed.news() == []
+    feed.advance()
+    assert [item["headline"] for item in feed.news()] == ["early"]
+    feed.advance()
+    assert [item["tickers"] for item in feed.news()] == [["EFGH"]]
+    assert len(feed.screener()) == 1
+    assert feed.advance() is None
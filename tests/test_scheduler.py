@@ -0,0 +1,145 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from controller.scheduler import RefreshScheduler
+
+# Tk root stand-in with a virtual clock: after() queues callbacks that advance() runs in time order
+class FakeRoot:
+    def __init__(self):
+        self.now = 0
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = (self.now + delay_ms, callback)
+        return self.next_id
+
+    def after_cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def advance(self, ms):
+        end = self.now + ms
+        while True:
+            due = [(when, timer_id) for timer_id, (when, _) in self.timers.items() if when <= end]
+            if not due:
+                break
+            when, timer_id = min(due)
+            self.now = when
+            _, callback = self.timers.pop(timer_id)
+            callback()
+        self.now = end
+
+# Worker stand-in whose jobs only finish when the test says so
+class FakeWorker:
+    def __init__(self):
+        self.pending = []
+        self.finished = []
+
+    def submit(self, kind, fn):
+        self.pending.append((kind, fn))
+
+    def finish_all(self):
+        for kind, fn in self.pending:
+            try:
+                self.finished.append((kind, fn(), None))
+            except Exception as e:
+                self.finished.append((kind, None, e))
+        self.pending = []
+
+    def drain(self):
+        finished, self.finished = self.finished, []
+        return finished
+
+    def shutdown(self):
+        pass
+
+def make_scheduler(job, interval_ms=1000):
+    root, worker, results = FakeRoot(), FakeWorker(), []
+    scheduler = RefreshScheduler(root, worker, poll_ms=10)
+    scheduler.add("screener", job, results.append, interval_ms=interval_ms)
+    scheduler.start()
+    return root, worker, scheduler, results
+
+def test_exactly_one_fetch_per_interval():
+    root, worker, scheduler, results = make_scheduler(lambda: "rows")
+
+    root.advance(500)
+    for _ in range(5):
+        worker.finish_all()
+        root.advance(1000)
+
+    stats = scheduler.stats()["screener"]
+    assert stats["ticks"] == 6
+    assert stats["started"] == 6
+    assert stats["skipped"] == 0
+    assert results == ["rows"] * 5
+
+def test_tick_is_skipped_while_previous_refresh_runs():
+    root, worker, scheduler, results = make_scheduler(lambda: "rows")
+
+    root.advance(3500)
+    stats = scheduler.stats()["screener"]
+    assert stats["started"] == 1
+    assert stats["skipped"] == 3
+
+    worker.finish_all()
+    root.advance(100)
+    assert results == ["rows"]
+    assert not scheduler.stats()["screener"]["running"]
+
+def test_failures_back_off_and_recover():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) <= 2:
+            raise ConnectionError("finviz down")
+        return "rows"
+
+    root, worker, scheduler, results = make_scheduler(flaky)
+    root.advance(1)
+    worker.finish_all()
+    root.advance(20)
+    assert scheduler.next_delay("screener") == 2000
+
+    root.advance(1000)
+    worker.finish_all()
+    root.advance(20)
+    assert scheduler.next_delay("screener") == 4000
+
+    root.advance(4000)
+    worker.finish_all()
+    root.advance(20)
+    assert results == ["rows"]
+    assert scheduler.next_delay("screener") == 1000
+    assert scheduler.stats()["screener"]["errors"] == 2
+
+def test_on_demand_jobs_run_only_when_requested():
+    root, worker, scheduler, results = make_scheduler(lambda: "rows", interval_ms=None)
+
+    root.advance(5000)
+    assert scheduler.stats()["screener"]["started"] == 0
+
+    scheduler.refresh_now("screener")
+    worker.finish_all()
+    root.advance(10)
+    assert results == ["rows"]
+
+def test_a_failing_render_does_not_stop_the_poller():
+    calls = []
+    def render(result):
+        calls.append(result)
+        raise ValueError("bad row")
+
+    root, worker = FakeRoot(), FakeWorker()
+    scheduler = RefreshScheduler(root, worker, poll_ms=10)
+    scheduler.add("screener", lambda: "rows", render, interval_ms=1000)
+    scheduler.start()
+
+    for _ in range(2):
+        root.advance(5)
+        worker.finish_all()
+        root.advance(995)
+    assert calls == ["rows", "rows"]
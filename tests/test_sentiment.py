@@ -0,0 +1,86 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+import pytest
+import core.sentiment as sentiment
+
+# Vectorizer stand-in that records which headlines were sent to the model
+class CountingVectorizer:
+    def __init__(self):
+        self.seen = []
+
+    def transform(self, headlines):
+        self.seen.extend(headlines)
+        return headlines
+
+# Model stand-in: headlines containing "beats" are positive with 90% confidence
+class KeywordModel:
+    classes_ = np.array([-1, 1])
+
+    def predict_proba(self, headlines):
+        return np.array([[0.1, 0.9] if "beats" in h else [0.8, 0.2] for h in headlines])
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(sentiment, "_prediction_cache", sentiment.PredictionCache(max_size=3))
+
+def test_only_new_headlines_reach_the_model():
+    model, vectorizer = KeywordModel(), CountingVectorizer()
+    sentiment.predict_headlines(["ABCD beats estimates", "EFGH misses"], model, vectorizer)
+    labels, confidences = sentiment.predict_headlines(["ABCD beats estimates", "IJKL beats"], model, vectorizer)
+
+    assert vectorizer.seen == ["ABCD beats estimates", "EFGH misses", "IJKL beats"]
+    assert labels == ["📈 Positive", "📈 Positive"]
+    assert confidences == [0.9, 0.9]
+    assert sentiment.prediction_cache_stats()["hits"] == 1
+
+def test_classify_tickers_shares_one_prediction_per_headline():
+    vectorizer = CountingVectorizer()
+    result = sentiment.classify_tickers({"ABCD": "beats", "EFGH": "beats", "IJKL": "misses"}, KeywordModel(), vectorizer)
+
+    assert result == {"ABCD": "📈 Positive (90%)", "EFGH": "📈 Positive (90%)", "IJKL": "📉 Negative (80%)"}
+    assert vectorizer.seen == ["beats", "misses"]
+
+def test_a_new_model_invalidates_cached_predictions():
+    vectorizer = CountingVectorizer()
+    sentiment.predict_headlines(["ABCD beats"], KeywordModel(), vectorizer)
+    sentiment.predict_headlines(["ABCD beats"], KeywordModel(), vectorizer)
+
+    assert vectorizer.seen == ["ABCD beats", "ABCD beats"]
+    assert sentiment.prediction_cache_stats()["invalidations"] == 1
+
+def test_cache_is_bounded():
+    model = KeywordModel()
+    sentiment.predict_headlines([f"headline {i}" for i in range(5)], model, CountingVectorizer())
+
+    stats = sentiment.prediction_cache_stats()
+    assert stats["size"] == 3
+    assert stats["evictions"] == 2
+
+def test_retrain_folds_in_only_appended_rows(tmp_path, monkeypatch):
+    labeled = pd.read_csv(sentiment.LABELED_DATA_PATH, encoding="utf-8")
+    labeled_path = tmp_path / "labeled.csv"
+    labeled.iloc[:700].to_csv(labeled_path, index=False)
+
+    first = sentiment.retrain_model_files("hashed", tmp_path, labeled_path)
+    assert first["trained_rows"] == 700
+    assert sentiment.retrain_model_files("hashed", tmp_path, labeled_path) is None
+    before = sentiment.load_model("hashed", tmp_path, mmap=False)[0].coef_.toarray()
+
+    # The appended rows must be folded in with partial_fit, never by training from scratch
+    def refit(*args, **kwargs):
+        raise AssertionError("retrained from scratch")
+    monkeypatch.setattr(sentiment, "train_model", refit)
+
+    labeled.to_csv(labeled_path, index=False)
+    second = sentiment.retrain_model_files("hashed", tmp_path, labeled_path)
+    model, vectorizer = sentiment.load_model("hashed", tmp_path, verify=True)
+
+    assert second["trained_rows"] == len(labeled)
+    assert second["version"] != first["version"]
+    assert sentiment.model_version(model) == second["version"]
+    assert len(sentiment.predict_headlines(["ABCD beats estimates"], model, vectorizer)[0]) == 1
+    assert not (model.coef_.toarray() == before).all()
@@ -0,0 +1,93 @@
+import sys
+import os
+import io
+import json
+import subprocess
+import urllib.request
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+from controller.service import ScreenerService
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Controller stand-in returning rows shaped like get_screener_results(); fails while self.fail is set
+class FakeController:
+    def __init__(self):
+        self.fail = False
+
+    def get_screener_results(self):
+        if self.fail:
+            raise ConnectionError("finviz down")
+        prime = [["ABCD", np.float64(4.5), 12.3, 6.1, "12.00%", np.float32(0.5), 1.25, 9.37, -3.1, "Positive"]]
+        subprime = [["EFGH", 3.2, pd.NA, np.float32(5.5), "10.50%", "", "", float("nan"), -2.0, ""]]
+        return prime, subprime
+
+    def metrics_report(self):
+        return {"stages": {"fetch": {"count": 1}}}
+
+    def get_positive_news(self):
+        return [{"headline": "ABCD wins contract", "confidence_score": np.float64(0.8), "tickers": ["ABCD"],
+                 "url": "https://example.com/abcd", "timestamp": "2026-10-12 09:31:00"}]
+
+def test_each_refresh_is_one_json_line():
+    output = io.StringIO()
+    service = ScreenerService(FakeController(), output=output)
+    service.run(once=True)
+
+    line = json.loads(output.getvalue())
+    assert line["prime"][0] == {"Ticker": "ABCD", "Price": 4.5, "Float": 12.3, "RelVolume": 6.1, "ChangePercent": "12.00%",
+                                "RelVolumeRate": 0.5, "ChangeRate": 1.25, "Target": 9.37, "StopLoss": -3.1, "Sentiment": "Positive"}
+    assert line["subprime"][0]["Float"] is None
+    assert line["subprime"][0]["Target"] is None
+    assert line["positive_news"][0]["confidence_score"] == 0.8
+
+def test_failures_back_off_and_keep_the_last_result():
+    controller = FakeController()
+    service = ScreenerService(controller, interval=10, max_backoff=30)
+    service.run(once=True)
+    controller.fail = True
+    service.run(once=True)
+    service.run(once=True)
+
+    assert service.next_delay() == 30
+    assert service.latest["prime"][0]["Ticker"] == "ABCD"
+    assert service.stats == {"refreshes": 1, "errors": 2}
+
+def test_http_endpoint_serves_the_latest_refresh():
+    service = ScreenerService(FakeController())
+    host, port = service.serve(port=0)
+    try:
+        service.run(once=True)
+        with urllib.request.urlopen(f"http://{host}:{port}/latest") as response:
+            body = json.load(response)
+        with urllib.request.urlopen(f"http://{host}:{port}/stats") as response:
+            stats = json.load(response)
+    finally:
+        service.stop()
+
+    assert body["prime"][0]["Ticker"] == "ABCD"
+    assert stats["refreshes"] == 1
+    assert stats["stages"]["fetch"]["count"] == 1
+
+def test_headless_entry_point_does_not_import_gui_or_chart_libraries():
+    code = "import sys, headless; print(sorted(m for m in ('tkinter', 'matplotlib', 'yfinance') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+def test_several_strategies_are_reported_from_one_refresh():
+    controller = FakeController()
+    controller.get_strategy_results = lambda names: {name: controller.get_screener_results() for name in names}
+    service = ScreenerService(controller, strategies=["default", "runner"])
+
+    result = service.refresh()
+    assert list(result["strategies"]) == ["default", "runner"]
+    assert result["strategies"]["runner"]["prime"][0]["Ticker"] == "ABCD"
+
+def test_headless_rejects_unknown_strategies_before_running():
+    result = subprocess.run([sys.executable, "headless.py", "--once", "--strategy", "default", "--strategy", "nope"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 2
+    assert "unknown strategy: nope" in result.stderr
+    assert result.stdout == ""
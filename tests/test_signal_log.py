@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from datetime import datetime
+import pytest
+from core.signal_log import CsvPrimeLog, SqlitePrimeLog
+
+STOCK = {"Ticker": "ABCD", "Price": 5.5, "Target": 12.1, "StopLoss": -3.2, "Sentiment": "📈 Positive (90%)"}
+MONDAY = datetime(2026, 10, 12, 9, 45)
+TUESDAY = datetime(2026, 10, 13, 10, 5)
+
+@pytest.fixture(params=["csv", "sqlite"])
+def open_log(request, tmp_path):
+    def opener(**kwargs):
+        if request.param == "csv":
+            return CsvPrimeLog(tmp_path / "prime_log.csv", **kwargs)
+        return SqlitePrimeLog(str(tmp_path / "prime_log.db"), **kwargs)
+    return opener
+
+def test_one_entry_per_ticker_per_day(open_log):
+    log = open_log()
+
+    assert log.record(STOCK, MONDAY)
+    assert not log.record(STOCK, MONDAY.replace(hour=15))
+    assert log.record(STOCK, TUESDAY)
+    assert [row["timestamp"][:10] for row in log.history("ABCD")] == ["2026-10-12", "2026-10-13"]
+
+def test_entries_are_buffered_and_the_index_survives_a_restart(open_log):
+    log = open_log(batch_size=10, flush_interval=3600)
+    log.record(STOCK, MONDAY)
+    assert open_log().history() == []
+
+    log.close()
+    reopened = open_log()
+    assert not reopened.record(STOCK, MONDAY)
+    assert [row["ticker"] for row in reopened.history(since="2026-10-12")] == ["ABCD"]
+
+def test_buffered_entries_are_flushed_once_the_interval_passes(open_log):
+    log = open_log(batch_size=10, flush_interval=3600)
+    log.record(STOCK, MONDAY)
+    log.flush_if_due()
+    assert open_log().history() == []
+
+    log.last_flush -= 3600  # an hour of refreshes with no new Prime setups
+    log.flush_if_due()
+    assert [row["ticker"] for row in open_log().history()] == ["ABCD"]
+
+def test_blank_csv_gets_a_header(tmp_path):
+    path = tmp_path / "prime_log.csv"
+    path.write_text("\n", encoding="utf-8")
+    log = CsvPrimeLog(path, batch_size=1)
+    log.record(STOCK, MONDAY)
+
+    assert path.read_text(encoding="utf-8").splitlines()[0] == "timestamp,ticker,price,target,stop_loss,sentiment"
+    assert len(log.history()) == 1
+
+def test_csv_with_other_columns_is_never_overwritten(tmp_path):
+    path = tmp_path / "prime_log.csv"
+    original = "timestamp,ticker,price,target,stop_loss,sentiment,notes\n2026-10-12T09:45:00,OLD,1,2,3,,kept\n"
+    path.write_text(original, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="move it aside"):
+        CsvPrimeLog(path, batch_size=1)
+    assert path.read_text(encoding="utf-8") == original
@@ -0,0 +1,12 @@
+import sys
+import os
+import subprocess
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+def test_app_modules_import_without_heavy_dependencies():
+    code = ("import sys, controller.controller, ui.view; "
+            "print(sorted(m for m in ('pandas', 'sklearn', 'joblib', 'textblob', 'matplotlib', 'yfinance') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
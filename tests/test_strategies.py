@@ -0,0 +1,91 @@
+import sys
+import os
+import json
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+import pytest
+from core.filters import add_price_levels, apply_filters, normalize_snapshot, rank_strategies, score_stocks
+from core.strategies import DEFAULT_STRATEGIES, Strategy, StrategySet, compiled_strategies, load_strategies
+
+def snapshot(short_float=True):
+    raw = pd.DataFrame({
+        "Ticker": ["ABCD", "EFGH", "IJKL", "MNOP"],
+        "Price": [5.5, 3.1, 25.0, 1.5],
+        "Prev Close": [4.8, 3.0, 20.0, 1.0],
+        "Change": ["14.58%", "3.33%", "25.00%", "50.00%"],
+        "Relative Volume": [7.2, 6.1, 9.0, 4.0],
+        "Shares Float": [12.5, 8.0, 15.0, 3.0],
+        "Short Float": ["8.5%", "12.0%", "6.0%", "15.0%"],
+        "Volatility (Week)": ["9.1%", "6.4%", "7.0%", "12.0%"],
+        "Relative Strength Index (14)": [68.0, 55.0, 80.0, 75.0],
+    })
+    if not short_float:
+        raw = raw.drop(columns=["Short Float"])
+    return normalize_snapshot(raw)
+
+RUNNER = {"rules": [{"column": "Price", "max": 10}, {"column": "Change%", "min": 20}, {"column": "Rel Volume", "min": 5},
+                    {"column": "Shares Float", "max": 5, "weight": 2}], "prime": 4, "subprime": 3}
+
+def test_default_strategy_scores_like_the_original_thresholds():
+    scores = score_stocks(snapshot(), strategies=StrategySet(load_strategies("missing.json")))["Score"]
+    assert list(scores) == [4, 3, 3, 2]
+
+    no_short_float = score_stocks(snapshot(short_float=False), strategies=StrategySet(load_strategies("missing.json")))
+    assert list(no_short_float["Score"]) == [3, 2, 2, 1]
+
+def test_filters_skip_rules_on_columns_the_export_lacks():
+    strategies = StrategySet(load_strategies("missing.json"))
+    assert list(apply_filters(snapshot(), strategies=strategies)["Ticker"]) == ["ABCD"]
+    assert list(apply_filters(snapshot(short_float=False), strategies=strategies)["Ticker"]) == ["ABCD"]
+
+def test_every_strategy_is_ranked_from_one_scoring_pass():
+    strategies = StrategySet({
+        "default": Strategy.from_config("default", DEFAULT_STRATEGIES["default"]),
+        "runner": Strategy.from_config("runner", RUNNER),
+    })
+    # The Rel Volume >= 5 rule appears in both strategies but is evaluated once
+    assert len(strategies.conditions) == 7
+
+    ranked = rank_strategies(snapshot(), strategies=strategies)
+    assert [row["Ticker"] for row in ranked["default"][0]] == ["ABCD"]
+    assert [row["Ticker"] for row in ranked["default"][1]] == ["EFGH", "IJKL"]
+    assert [row["Ticker"] for row in ranked["runner"][0]] == ["MNOP"]
+    assert ranked["runner"][1] == []
+    assert ranked["runner"][0][0]["Target"] == round(0.7 * 12.0 + 0.03 * (70 - 75.0), 2)
+
+    with pytest.raises(ValueError):
+        rank_strategies(snapshot(), ["nope"], strategies)
+
+def test_config_file_is_validated_and_reloaded_when_it_changes(tmp_path):
+    path = tmp_path / "strategies.json"
+    path.write_text(json.dumps({"runner": RUNNER}))
+    assert compiled_strategies(str(path)).names == ["runner"]
+    assert compiled_strategies(str(path)) is compiled_strategies(str(path))
+
+    path.write_text(json.dumps({"runner": RUNNER, "wide": {"rules": [{"column": "Price", "min": 1}]}}))
+    os.utime(path, (1, 1))
+    strategies = compiled_strategies(str(path))
+    assert strategies.names == ["runner", "wide"]
+    assert (strategies["wide"].prime, strategies["wide"].subprime) == (1, 1)
+
+    path.write_text(json.dumps({"zero": {"rules": [{"column": "Price", "min": 1}], "prime": 1, "subprime": 0}}))
+    with pytest.raises(ValueError):
+        load_strategies(str(path))
+
+    path.write_text(json.dumps({"broken": {"rules": [{"column": "Price"}]}}))
+    with pytest.raises(ValueError):
+        load_strategies(str(path))
+
+def test_one_rule_strategy_puts_nothing_in_subprime():
+    strategies = StrategySet({"expensive": Strategy.from_config("expensive", {"rules": [{"column": "Price", "min": 100}]})})
+
+    assert rank_strategies(snapshot(), strategies=strategies)["expensive"] == ([], [])
+
+def test_half_cent_levels_round_away_from_zero():
+    # round() gives 0.84 and -9.14 here: 0.845 and -9.145 come out a hair inside the half cent in binary
+    levels = add_price_levels(pd.DataFrame({"Volatility (Week)": [0.11, 32.53, 12.0],
+                                            "Relative Strength Index (14)": [44.4, 80.7, 75.0]}))
+
+    assert levels["Target"].tolist() == [0.85, 22.45, 8.25]
+    assert levels["StopLoss"].tolist() == [-0.15, -9.15, -3.1]
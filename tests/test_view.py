@@ -0,0 +1,103 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from types import SimpleNamespace
+from ui.view import View, appends_only, diff_rows
+
+def test_diff_rows_finds_added_changed_and_removed_keys():
+    shown = {"ABCD": (1,), "EFGH": (2,), "IJKL": (3,)}
+    rows = {"EFGH": (2,), "ABCD": (9,), "MNOP": (4,)}
+
+    assert diff_rows(shown, rows) == (["MNOP"], ["ABCD"], ["IJKL"])
+    assert diff_rows(rows, rows) == ([], [], [])
+
+def test_only_a_changed_order_needs_a_reorder():
+    shown = {"ABCD": 1, "EFGH": 2, "IJKL": 3}
+
+    # Departed rows and new rows at the end keep the order
+    assert appends_only(shown, ["MNOP"], {"ABCD": 1, "IJKL": 3, "MNOP": 4})
+    # A new row ranked above existing ones, or two rows swapping, does not
+    assert not appends_only(shown, ["MNOP"], {"MNOP": 4, "ABCD": 1, "EFGH": 2, "IJKL": 3})
+    assert not appends_only(shown, [], {"EFGH": 2, "ABCD": 1, "IJKL": 3})
+
+# Treeview stand-in that records the calls sync_tree makes
+class FakeTree:
+    def __init__(self):
+        self.calls = []
+
+    def delete(self, key):
+        self.calls.append(("delete", key))
+
+    def item(self, key, values):
+        self.calls.append(("item", key))
+
+    def insert(self, parent, index, iid, values, tags):
+        self.calls.append(("insert", iid))
+
+    def move(self, key, parent, index):
+        self.calls.append(("move", key, index))
+
+def test_sync_tree_touches_only_what_changed():
+    tree = FakeTree()
+    view = SimpleNamespace(screener_trees={"prime": tree}, screener_rows={"prime": {}})
+
+    View.sync_tree(view, "prime", [["ABCD", 5.5], ["EFGH", 3.1]])
+    View.sync_tree(view, "prime", [["ABCD", 5.6], ["EFGH", 3.1], ["IJKL", 2.0]])
+    assert tree.calls == [("insert", "ABCD"), ("insert", "EFGH"), ("item", "ABCD"), ("insert", "IJKL")]
+
+    tree.calls.clear()
+    View.sync_tree(view, "prime", [["IJKL", 2.0], ["ABCD", 5.6]])
+    assert tree.calls == [("delete", "EFGH"), ("move", "IJKL", 0), ("move", "ABCD", 1)]
+    assert list(view.screener_rows["prime"]) == ["IJKL", "ABCD"]
+
+# News card frame stand-in that records packing
+class FakeFrame:
+    def __init__(self, key, log):
+        self.key, self.log = key, log
+
+    def pack(self, **kwargs):
+        self.log.append(("pack", self.key))
+
+    def pack_forget(self):
+        self.log.append(("forget", self.key))
+
+    def destroy(self):
+        self.log.append(("destroy", self.key))
+
+def news(*urls):
+    return [{"headline": url, "tickers": ["ABCD"], "confidence_score": 0.8, "url": url} for url in urls]
+
+def test_news_cards_repack_only_when_the_order_changes():
+    log = []
+    view = SimpleNamespace(news_cards={}, controller=None)
+    view.build_news_card = lambda text, url: {"frame": FakeFrame(url, log), "label": None, "text": text}
+
+    View.render_breaking_news_tab(view, news("a", "b"))
+    View.render_breaking_news_tab(view, news("a", "b", "c"))
+    assert log == [("pack", "a"), ("pack", "b"), ("pack", "c")]
+
+    log.clear()
+    View.render_breaking_news_tab(view, news("d", "a", "c"))
+    assert log == [("destroy", "b"), ("forget", "d"), ("forget", "a"), ("forget", "c"),
+                   ("pack", "d"), ("pack", "a"), ("pack", "c")]
+    assert list(view.news_cards) == ["d", "a", "c"]
+
+# Matplotlib axes stand-in that records what was drawn
+class FakeAxes:
+    def __init__(self):
+        self.calls = []
+        self.transAxes = None
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args))
+
+def test_failed_chart_clears_the_figure_and_shows_the_error():
+    axes = FakeAxes()
+    view = SimpleNamespace(chart_ticker="ABCD", chart_canvas=SimpleNamespace(draw_idle=lambda: axes.calls.append(("draw", ()))),
+                           chart_axes=axes)
+
+    View.render_chart(view, ("ABCD", None, "No data returned"))
+
+    assert [name for name, _ in axes.calls] == ["clear", "set_axis_off", "text", "draw"]
+    assert "Failed to load chart for ABCD:\nNo data returned" in axes.calls[2][1][2]
@@ -1,8 +1,46 @@
-import yfinance as yf
-import matplotlib.pyplot as plt
-from tkinter import Frame, Label, Button, Canvas, Scrollbar, StringVar, Entry, VERTICAL, RIGHT, LEFT, Y, BOTH, ttk
+import json
+from tkinter import Frame, Label, Button, Canvas, Scrollbar, StringVar, Entry, Text, VERTICAL, RIGHT, LEFT, Y, BOTH, END, ttk
 from tkinter.font import Font
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from controller.scheduler import RefreshScheduler
+
+# Refresh intervals for the live panels (ms)
+SCREENER_REFRESH_MS = 15000
+NEWS_REFRESH_MS = 15000
+DEBUG_REFRESH_MS = 5000
+
+SCREENER_COLUMNS = ["Ticker", "Price", "Float (M)", "Rel Volume", "Change From Prev Close", "Rel Vol Δ/min",
+                    "Change Δ/min", "Target (%)", "Stop Loss (%)"]
+
+# Compares keyed rows against what a widget shows; returns the added, changed and removed keys
+def diff_rows(shown, rows):
+    added = [key for key in rows if key not in shown]
+    changed = [key for key in rows if key in shown and shown[key] != rows[key]]
+    removed = [key for key in shown if key not in rows]
+    return added, changed, removed
+
+# Whether the new rows keep the shown order with only the added keys at the end, so nothing has to move
+def appends_only(shown, added, rows):
+    return [key for key in shown if key in rows] + added == list(rows)
+
+# Renders a metrics report as aligned text for the debug tab
+def format_metrics(report):
+    lines = [f"{'stage':<22}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for stage, stats in report.get("stages", {}).items():
+        lines.append(f"{stage:<22}{stats['count']:>8}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+
+    lines += ["", f"{'count':<22}{'last':>8}{'max':>10}"]
+    for name, stats in report.get("counts", {}).items():
+        lines.append(f"{name:<22}{stats['last']:>8}{stats['max']:>10}")
+
+    lines += ["", "errors"]
+    for stage, stats in report.get("errors", {}).items():
+        lines.append(f"{stage:<22}{stats['count']:>8}  {stats['at']}  {stats['last']}")
+
+    for section in ("caches", "scheduler"):
+        lines += ["", section]
+        for name, stats in report.get(section, {}).items():
+            lines.append(f"{name:<22}{json.dumps(stats, default=str)}")
+    return "\n".join(lines)
 
 class View:
     # Initializes the GUI layout and all tabs
@@ -11,97 +49,165 @@ class View:
         self.controller = controller
         self.root.title("Stock Screener")
         self.root.geometry("1000x700")
+        self.scheduler = RefreshScheduler(self.root)
 
         self.tab_control = ttk.Notebook(self.root)
         self.screener_tab = Frame(self.tab_control)
         self.chart_tab = Frame(self.tab_control)
         self.breaking_tab = Frame(self.tab_control)
+        self.debug_tab = Frame(self.tab_control)
 
         self.tab_control.add(self.screener_tab, text="📈 Stock Screener")
         self.tab_control.add(self.chart_tab, text="📊 Stock Chart")
         self.tab_control.add(self.breaking_tab, text="📢 Breaking News")
+        self.tab_control.add(self.debug_tab, text="🛠 Debug")
         self.tab_control.pack(expand=1, fill="both")
 
         self.build_screener_panel(self.screener_tab)
         self.build_chart_panel(self.chart_tab)
         self.build_breaking_news_tab(self.breaking_tab)
+        self.build_debug_panel(self.debug_tab)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)  # Handle proper shutdown
+        self.scheduler.start()
 
-    # Builds and populates the screener tab
+    # Builds the screener tab's persistent Prime/Subprime tables; refreshes only diff their rows
     def build_screener_panel(self, parent):
         self.screener_container = parent
-        self.refresh_screener_panel()
-        self.root.after(10000, self.refresh_screener_panel)
-
-    # Refreshes the screener tab with new filtered stock data
-    def refresh_screener_panel(self):
-        for widget in self.screener_container.winfo_children():
-            widget.destroy()
-
-        prime, subprime = self.controller.get_screener_results()
-
-        def add_section(title, data, tag):
-            Label(self.screener_container, text=title, font=("Arial", 14, "bold")).pack(pady=(10, 0))
-            tree = ttk.Treeview(self.screener_container, columns=["Ticker", "Price", "Float (M)", "Rel Volume", "Change From Prev Close", "Target (%)", "Stop Loss (%)"], show="headings")
-            for col in ["Ticker", "Price", "Float (M)", "Rel Volume", "Change From Prev Close", "Target (%)", "Stop Loss (%)"]:
+        self.screener_loading = Label(parent, text="⏳ Loading screener...", font=("Arial", 12))
+        self.screener_loading.pack(pady=20)
+        self.screener_trees = {}
+        self.screener_rows = {}
+
+        for title, tag in [("⭐ Prime Setup", "prime"), ("⚠️ Subprime Setup", "subprime")]:
+            Label(parent, text=title, font=("Arial", 14, "bold")).pack(pady=(10, 0))
+            tree = ttk.Treeview(parent, columns=SCREENER_COLUMNS, show="headings")
+            for col in SCREENER_COLUMNS:
                 tree.heading(col, text=col)
                 tree.column(col, anchor="center", width=100)
 
             tree.tag_configure("prime", background="#d4edda") #Light Green
             tree.tag_configure("subprime", background="#fff3cd") #Light Yellow
-
-            for row in data:
-                tree.insert("", "end", values=row, tags=(tag,))
-
             tree.pack(expand=True, fill="both", padx=10, pady=5)
 
-        add_section("⭐ Prime Setup", prime, tag="prime")
-        add_section("⚠️ Subprime Setup", subprime, tag="subprime")
+            self.screener_trees[tag] = tree
+            self.screener_rows[tag] = {}
 
-        self.root.after(15000, self.refresh_screener_panel)
+        self.scheduler.add(
+            "screener",
+            self.controller.get_screener_results,
+            lambda result: self.render_screener_panel(*result),
+            interval_ms=SCREENER_REFRESH_MS
+        )
 
-    # Builds the breaking news tab
+    # Requests a screener refresh now unless one is already running
+    def refresh_screener_panel(self):
+        self.scheduler.refresh_now("screener")
+
+    # Applies new filtered stock data to the screener tables and warms the chart cache for the listed tickers
+    def render_screener_panel(self, prime, subprime):
+        if self.screener_loading:
+            self.screener_loading.destroy()
+            self.screener_loading = None
+
+        self.sync_tree("prime", prime)
+        self.sync_tree("subprime", subprime)
+        self.controller.prefetch_prices([row[0] for row in prime + subprime])
+
+    # Inserts new tickers, updates changed cells and deletes departed rows, keeping scroll and selection
+    def sync_tree(self, tag, data):
+        tree = self.screener_trees[tag]
+        shown = self.screener_rows[tag]
+        rows = {str(row[0]): tuple(row) for row in data}
+        added, changed, removed = diff_rows(shown, rows)
+
+        for key in removed:
+            tree.delete(key)
+        for key in changed:
+            tree.item(key, values=rows[key])
+        for key in added:
+            tree.insert("", "end", iid=key, values=rows[key], tags=(tag,))
+
+        # Only reorder when the refresh ranked rows differently
+        if not appends_only(shown, added, rows):
+            for index, key in enumerate(rows):
+                tree.move(key, "", index)
+
+        self.screener_rows[tag] = rows
+
+    # Builds the breaking news tab's persistent scroll area; refreshes only diff its cards
     def build_breaking_news_tab(self, parent):
         self.breaking_news_container = parent
-        self.refresh_breaking_news_tab()
-        self.root.after(15000, self.refresh_breaking_news_tab)
+        self.news_cards = {}
+        self.news_font = Font(weight="bold")
+        self.add_retrain_button(parent)
 
-    # Refreshes the breaking news tab with new headlines
-    def refresh_breaking_news_tab(self):
-        for widget in self.breaking_news_container.winfo_children():
-            widget.destroy()
+        canvas = Canvas(parent)
+        scrollbar = Scrollbar(parent, orient="vertical", command=canvas.yview)
+        self.news_frame = Frame(canvas)
 
-        canvas = Canvas(self.breaking_news_container)
-        scrollbar = Scrollbar(self.breaking_news_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = Frame(canvas)
-
-        scrollable_frame.bind(
+        self.news_frame.bind(
             "<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.create_window((0, 0), window=self.news_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
         canvas.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=RIGHT, fill=Y)
 
-        headlines = self.controller.get_positive_news()
+        self.scheduler.add(
+            "news",
+            self.controller.get_positive_news,
+            self.render_breaking_news_tab,
+            interval_ms=NEWS_REFRESH_MS
+        )
+
+    # Requests a news refresh now unless one is already running
+    def refresh_breaking_news_tab(self):
+        self.scheduler.refresh_now("news")
 
+    # Applies new headlines to the breaking news tab, keyed by article URL
+    def render_breaking_news_tab(self, headlines):
+        items = {}
         for item in headlines:
-            frame = Frame(scrollable_frame, borderwidth=1, relief="solid", padx=5, pady=5)
-            frame.pack(fill="x", pady=4, padx=5)
-
-            headline = item['headline']
             ticker = ", ".join(item['tickers'])
-            url = item['url']
             confidence = int(item['confidence_score'] * 100)
+            text = f"📰 {item['headline']}\n📊 {ticker} | Confidence: {confidence}%"
+            items[item['url'] or item['headline']] = (text, item['url'])
+
+        shown = {key: card["text"] for key, card in self.news_cards.items()}
+        added, changed, removed = diff_rows(shown, {key: text for key, (text, _) in items.items()})
+
+        for key in removed:
+            self.news_cards.pop(key)["frame"].destroy()
+        for key in changed:
+            text = items[key][0]
+            self.news_cards[key]["label"].config(text=text)
+            self.news_cards[key]["text"] = text
+        for key in added:
+            self.news_cards[key] = self.build_news_card(*items[key])
+
+        # New cards go at the end unless the order changed, in which case everything is repacked
+        if appends_only(shown, added, items):
+            repack = added
+        else:
+            repack = list(items)
+            for key in repack:
+                self.news_cards[key]["frame"].pack_forget()
+        for key in repack:
+            self.news_cards[key]["frame"].pack(fill="x", pady=4, padx=5)
+
+        self.news_cards = {key: self.news_cards[key] for key in items}
 
-            lbl = Label(frame, text=f"📰 {headline}\n📊 {ticker} | Confidence: {confidence}%",
-                        justify="left", wraplength=800, fg="blue", cursor="hand2", font=Font(weight="bold"))
-            lbl.pack(anchor="w")
+    # Creates one clickable headline card (not yet packed)
+    def build_news_card(self, text, url):
+        frame = Frame(self.news_frame, borderwidth=1, relief="solid", padx=5, pady=5)
+        lbl = Label(frame, text=text, justify="left", wraplength=800, fg="blue", cursor="hand2", font=self.news_font)
+        lbl.pack(anchor="w")
 
-            lbl.bind("<Button-1>", lambda e, url=url: self.controller.open_url(url))
+        lbl.bind("<Button-1>", lambda e, url=url: self.controller.open_url(url))
+        return {"frame": frame, "label": lbl, "text": text}
 
     """# Adds a box to manually enter and classify a custom headline
     def build_manual_input_box(self, parent):
@@ -132,7 +238,7 @@ class View:
             confidence = int(result['confidence_score'] * 100)
             self.prediction_output.set(f"Prediction: {label} ({confidence}% confidence)")
         else:
-            self.prediction_output.set("⚠️ Model not ready or headline invalid.")
+            self.prediction_output.set("⚠️ Model not ready or headline invalid.")"""
 
     # Adds a button to trigger retraining the sentiment model
     def add_retrain_button(self, parent):
@@ -141,9 +247,9 @@ class View:
             text="🔁 Retrain Model from Labels",
             command=self.controller.retrain_model,
             bg="#4CAF50", fg="white", padx=10, pady=5
-        ).pack(pady=10)"""
+        ).pack(pady=10)
 
-    # Builds the stock chart tab UI
+    # Builds the stock chart tab UI; the figure every chart is drawn on is created with the first chart
     def build_chart_panel(self, parent):
         frame = Frame(parent)
         frame.pack(pady=20)
@@ -158,36 +264,84 @@ class View:
         self.chart_frame = Frame(parent)
         self.chart_frame.pack(expand=True, fill="both")
 
-    # Uses yfinance to plot a 5-day intraday stock chart
+        self.chart_ticker = ""
+        self.chart_canvas = None
+
+        self.scheduler.add("chart", self.load_chart, self.render_chart, interval_ms=None)
+
+    # Loads the 5-day intraday chart for the entered ticker in the background
     def plot_chart(self):
         ticker = self.ticker_var.get().upper().strip()
         if not ticker:
             return
 
-        try:
-            df = yf.download(ticker, period="5d", interval="30m")
-            if df.empty:
-                raise ValueError("No data returned")
+        self.chart_ticker = ticker
+        self.scheduler.refresh_now("chart")
+
+    # Runs on a worker thread: fetches bars for the requested ticker through the price cache
+    def load_chart(self):
+        ticker = self.chart_ticker
+        return (ticker, *self.controller.load_chart(ticker))
 
-            for widget in self.chart_frame.winfo_children():
-                widget.destroy()
+    # Redraws the chart figure, or clears it and shows why the chart could not be loaded; a ticker entered while
+    # the last one was loading is fetched next
+    def render_chart(self, result):
+        ticker, df, error = result
+        if ticker != self.chart_ticker:
+            self.scheduler.refresh_now("chart")
+            return
 
-            fig, ax = plt.subplots(figsize=(6, 4))
-            df['Close'].plot(ax=ax)
-            ax.set_title(f"{ticker} - 5 Day Price Chart")
-            ax.set_ylabel("Price")
+        if self.chart_canvas is None:
+            self.build_chart_canvas()
 
-            canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
-        except Exception as e:
-            print(f"⚠️ Failed to load chart: {e}")
+        self.chart_axes.clear()
+        if error is not None:
+            self.chart_axes.set_axis_off()
+            self.chart_axes.text(0.5, 0.5, f"⚠️ Failed to load chart for {ticker}:\n{error}",
+                                 ha="center", va="center", transform=self.chart_axes.transAxes)
+        else:
+            self.chart_axes.set_axis_on()
+            df['Close'].plot(ax=self.chart_axes)
+            self.chart_axes.set_title(f"{ticker} - 5 Day Price Chart")
+            self.chart_axes.set_ylabel("Price")
+        self.chart_canvas.draw_idle()
     
+    # Builds the debug tab: per-stage latencies, row counts, errors and cache counters, refreshed on a timer
+    def build_debug_panel(self, parent):
+        Button(parent, text="💾 Dump Metrics", command=self.dump_metrics).pack(pady=10)
+        self.metrics_status = Label(parent, text="")
+        self.metrics_status.pack()
+        self.metrics_text = Text(parent, font=("Courier", 10), wrap="none")
+        self.metrics_text.pack(expand=True, fill="both", padx=10, pady=5)
+
+        self.scheduler.add("debug", self.controller.metrics_report, self.render_debug_panel, interval_ms=DEBUG_REFRESH_MS)
+
+    # Shows a metrics report with the scheduler's own counters added
+    def render_debug_panel(self, report):
+        self.metrics_text.delete("1.0", END)
+        self.metrics_text.insert(END, format_metrics({**report, "scheduler": self.scheduler.stats()}))
+
+    # Writes the current metrics to data/metrics.json
+    def dump_metrics(self):
+        path = self.controller.dump_metrics()
+        self.metrics_status.config(text=f"Saved {path}")
+
+    # Creates the reused chart figure; matplotlib is only imported once a chart is shown
+    def build_chart_canvas(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.chart_figure = Figure(figsize=(6, 4))
+        self.chart_axes = self.chart_figure.add_subplot()
+        self.chart_canvas = FigureCanvasTkAgg(self.chart_figure, master=self.chart_frame)
+        self.chart_canvas.get_tk_widget().pack(fill="both", expand=True)
+
     def on_close(self):
         """
         Gracefully handles the app window being closed.
-        Closes all Matplotlib figures and destroys the Tkinter window to prevent process hang.
+        Stops background work and destroys the Tkinter window to prevent process hang.
         """
         
-        plt.close('all')  # Close any open matplotlib figures
+        self.scheduler.stop()  # Cancel refresh timers and drop queued refreshes
+        self.controller.close()  # Flush buffered prime log entries and drop queued price downloads
         self.root.destroy()  # Cleanly close the Tkinter window